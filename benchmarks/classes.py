@@ -0,0 +1,25 @@
+# Builds the class hierarchy of a doc.h made of one inheritance chain whose
+# classes are listed children first, the worst case of the former repeated scan.
+#   python benchmarks/classes.py [count ...]
+from pymaniascript.msobjects import TypeUniverse
+from pymaniascript.msobjects.classes import compute_class_records, compute_classes
+import sys
+import time
+
+def chain (count):
+    doch = dict()
+    for i in reversed(range(count)):
+        doch[f'C{i}'] = { 'inherits'  : [ {'class': f'C{i - 1}'} ] if i != 0 else [],
+                          'enums'     : { 'public': [] },
+                          'properties': { 'public': [] },
+                          'methods'   : { 'public': [] } }
+    return doch
+
+for count in map(int, sys.argv[1:] or [1000, 2000, 4000, 8000]):
+    records = compute_class_records(chain(count))
+    universe = TypeUniverse()
+    universe.classes.loader = universe.namespaces.loader = None
+
+    start = time.perf_counter()
+    compute_classes(universe, records)
+    print(f'{count:6d} classes {time.perf_counter() - start:8.3f}s')
@@ -0,0 +1,31 @@
+# Compiles scripts full of comments, best of 3.
+#   python benchmarks/comments.py
+from generate import write_doch
+from pymaniascript.compiler import compile
+from pymaniascript.compiler.parser import COMPUTED_FILES
+from pymaniascript.msobjects import TypeUniverse
+import os
+import tempfile
+import time
+
+SCRIPTS = { 'Documented.Script.txt': ''.join(f'/**\n * Function {i}\n * @param _X value\n */\n// helper {i}\n'
+                                             f'Integer F{i}(Integer _X) {{ return _X + {i}; // add\n}}\n'
+                                             for i in range(2000)) + 'main() {}\n',
+            'Comments.Script.txt'  : ''.join(f'// line comment {i}\n/* block {i} */\n' for i in range(20000)) + 'main() {}\n' }
+
+with tempfile.TemporaryDirectory() as folder:
+    write_doch(os.path.join(folder, 'doc.h'), 0)
+    universe = TypeUniverse(os.path.join(folder, 'doc.h'))
+    os.makedirs(os.path.join(folder, 'Scripts'))
+
+    for filepath, text in SCRIPTS.items():
+        with open(os.path.join(folder, 'Scripts', filepath), 'w') as f: f.write(text)
+
+        best = None
+        for _ in range(3):
+            COMPUTED_FILES.clear()
+            start = time.perf_counter()
+            prog = compile(filepath, os.path.join(folder, 'Scripts'), universe)
+            duration = time.perf_counter() - start
+            best = duration if best == None else min(best, duration)
+        print(f'{filepath:24s} {text.count("/*") + text.count("//"):6d} comments {best:7.3f}s {len(prog.reports)} reports')
@@ -0,0 +1,35 @@
+# Parses a synthetic doc.h with every backend and checks they give the same records.
+#   python benchmarks/doch.py [classes ...]
+from generate import write_doch
+from pymaniascript.doch import BACKENDS
+import os
+import sys
+import tempfile
+import time
+
+# The part of the records the package reads
+def summary (records):
+    return { name: ([ parent['class'] for parent in record['inherits'] ],
+                    { access: [ (enum['name'], [ value['name'] for value in enum['values'] ]) for enum in enums ]
+                      for access, enums in record['enums'].items() },
+                    { access: [ (property['type'], property['name'], property['constant']) for property in properties ]
+                      for access, properties in record['properties'].items() },
+                    { access: [ (method['name'], method['rtnType'], [ arg['type'] for arg in method['parameters'] ])
+                                for method in methods ]
+                      for access, methods in record['methods'].items() })
+             for name, record in records.items() }
+
+with tempfile.TemporaryDirectory() as folder:
+    for count in map(int, sys.argv[1:] or [600, 3000]):
+        filename = os.path.join(folder, f'doc{count}.h')
+        write_doch(filename, count)
+
+        results = dict()
+        for name, backend in BACKENDS.items():
+            start = time.perf_counter()
+            records = backend(filename)
+            print(f'{count:6d} classes {name:16s} {time.perf_counter() - start:7.3f}s')
+            results[name] = summary(records)
+
+        reference, *others = results.values()
+        print('       same records' if all( other == reference for other in others ) else '       RECORDS DIFFER')
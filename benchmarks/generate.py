@@ -0,0 +1,72 @@
+import random
+
+# Synthetic inputs for the benchmarks, written in the same dialect as the
+# doc.h generated by the game
+
+__BUILTINS = '''struct Void {};
+struct Integer{};
+struct Real{};
+struct Boolean{};
+struct Text{};
+struct Vec2{Real X; Real Y;};
+struct Vec3{Real X; Real Y; Real Z;};
+struct Int2{Integer X; Integer Y;};
+struct Int3{Integer X; Integer Y; Integer Z;};
+struct Ident{};
+template <typename ElemType>
+struct Array {
+	ElemType operator[](Integer Index);
+	Integer count;
+	Array<ElemType> sort();
+	Boolean exists(ElemType Elem);
+};
+template <typename KeyType, typename ElemType>
+struct AssociativeArray {
+	ElemType operator[](KeyType Key);
+	Integer count;
+};
+'''
+
+__NAMESPACES = '''namespace MathLib {
+
+	enum EAxis {
+		X,
+		Y,
+	};
+	Integer Abs(Integer _Argument1);
+	Real Abs(Real _Argument1);
+	Real Cos(Real _Argument1);
+	Real Sin(Real _Argument1);
+	const Real Pi = 3.14159;
+};
+
+namespace TextLib {
+
+	Text ToText(Integer _Argument1);
+	Integer ToInteger(Text _Text);
+};
+'''
+
+# 'count' classes, each inheriting from one of the few classes declared before it
+def write_doch (filename, count, seed=1):
+    rnd = random.Random(seed)
+    names = [ 'CNod' ] + [ f'CClass{i}' for i in range(count) ]
+    parts = [ __BUILTINS, 'class CNod {\npublic :\n\tconst Ident Id;\n};\n' ]
+
+    for i in range(count):
+        name, parent = names[i + 1], names[rnd.randint(max(0, i - 5), i)]
+        lines = [ f'/*!\n\\brief {name}\n*/\nclass {name} : public {parent} {{\npublic :' ]
+        lines.append(f'\tenum EKind{i} {{\n\t\tA,\n\t\t*unused*,\n\t\tB,\n\t}};')
+        for j in range(8):
+            type = rnd.choice(['Integer', 'Real', 'Text', 'Boolean', f'Array<{parent}>',
+                               'AssociativeArray<Text, Integer>', parent, f'{name}::EKind{i}'])
+            lines.append(f'\t{"const " if rnd.random() < .3 else ""}{type} Prop{j};')
+        for j in range(6):
+            args = ', '.join(f'{rnd.choice(["Integer", "Text", parent, "Array<Text>"])} A{k}' for k in range(rnd.randint(0, 3)))
+            lines.append(f'\t{rnd.choice(["Void", "Integer", parent, "Array<Integer>"])} Method{j}({args});')
+        lines.append('};\n')
+        parts.append('\n'.join(lines))
+
+    parts.append(__NAMESPACES)
+    with open(filename, 'w') as f:
+        f.write('\n'.join(parts))
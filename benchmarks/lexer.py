@@ -0,0 +1,32 @@
+# Lexes generated scripts: long ones, and pathological comments and strings.
+#   python benchmarks/lexer.py [case ...]
+from generate import write_doch
+from pymaniascript.compiler.lexer import Lexer
+from pymaniascript.msobjects import TypeUniverse
+import os
+import sys
+import tempfile
+import time
+
+def lines (count):
+    return '\n'.join(f'declare Integer G_Var{i} = {i} + 2 * ({i} - 1); // comment {i}' for i in range(count))
+
+CASES = { '1000 lines'                    : lines(1000),
+          '5000 lines'                    : lines(5000),
+          '20000 lines'                   : lines(20000),
+          '100KB block comment'           : '/*' + ('x' * 79 + '\n') * 1280 + '*/ main() {}',
+          '1MB triple-quoted string'      : 'declare Text T = """' + '<label text="a" z="{{b}}"/>\n' * 37000 + '""";',
+          '1MB interpolated string'       : 'declare Text T = """' + '<label text="a"/>\n' * 20000 + '{{{ X }}}' + '<frame/>\n' * 60000 + '""";',
+          '\'/* x \' * 20000'             : '/* x ' * 20000,
+          '\'}}} x \' * 5000'             : '}}} x ' * 5000,
+          '\'"\' + \'\\"\' * 50000'       : '"' + '\\"' * 50000 }
+
+with tempfile.TemporaryDirectory() as folder:
+    write_doch(os.path.join(folder, 'doc.h'), 0)
+    universe = TypeUniverse(os.path.join(folder, 'doc.h'))
+
+    for name, text in CASES.items():
+        if len(sys.argv) > 1 and not any( arg in name for arg in sys.argv[1:] ): continue
+        start = time.perf_counter()
+        tokens = sum( 1 for _ in Lexer(universe).tokenize(text) )
+        print(f'{name:28s} {len(text) / 1e3:7.0f} KB {tokens:7d} tokens {time.perf_counter() - start:8.3f}s')
@@ -0,0 +1,69 @@
+# Memory taken by the AST of a generated script, compiled after the universe
+# and the parser tables are warmed up on a small one.
+#   python benchmarks/memory.py [functions] [rss]
+# With 'rss', tracemalloc is off and only the growth of the peak RSS is shown.
+from generate import write_doch
+from pymaniascript.compiler.files import FileCache
+from pymaniascript.compiler.parser import Parser
+from pymaniascript.msobjects import TypeUniverse
+import gc
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+FUNCTION = '''
+Integer F{i}(Integer _A, Real _B) {{
+	declare Integer X = _A * 2 + 3;
+	declare Real Y = _B / 2. - X;
+	declare Text T = "v" ^ X ^ " " ^ Y;
+	declare Integer[] L = [1, 2, 3, X];
+	for (I, 0, 10) {{
+		if (I % 2 == 0 && X > I) X += I; else X -= 1;
+	}}
+	foreach (V in L) {{ X += V; }}
+	while (X > 100) {{ X = X / 2; }}
+	return X + F{j}(X, Y);
+}}
+'''
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 1500
+traced = 'rss' not in sys.argv[2:]
+
+with tempfile.TemporaryDirectory() as folder:
+    write_doch(os.path.join(folder, 'doc.h'), 0)
+    universe = TypeUniverse(os.path.join(folder, 'doc.h'))
+    root = os.path.join(folder, 'Scripts')
+    os.makedirs(root)
+
+    text = ''.join( FUNCTION.format(i=i, j=max(i - 1, 0)) for i in range(count) ) + '\nmain() {\n\tF0(1, 2.);\n}\n'
+    with open(os.path.join(root, 'Memory.Script.txt'), 'w') as f: f.write(text)
+    with open(os.path.join(root, 'Warm.Script.txt'), 'w') as f: f.write(FUNCTION.format(i=0, j=0) + '\nmain() {\n}\n')
+    kloc = text.count('\n') / 1000
+
+    Parser(root, universe, files=FileCache()).parse_file('Warm.Script.txt')
+    gc.collect()
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    if traced: tracemalloc.start()
+    start = time.perf_counter()
+    prog = Parser(root, universe, files=FileCache()).parse_file('Memory.Script.txt')
+    duration = time.perf_counter() - start
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory() if traced else (0, 0)
+    tracemalloc.stop()
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss
+
+    nodes, stack = 0, [ prog ]
+    while len(stack) != 0:
+        node = stack.pop()
+        nodes += 1
+        stack.extend(node.children)
+
+    print(f'{kloc:.1f} KLOC, {nodes} nodes, {len(prog.reports)} reports, {duration:.2f}s' + (' (traced)' if traced else ''))
+    if traced:
+        print(f'retained {retained / 1e6:.1f} MB = {retained / nodes:.0f} B/node, '
+              f'traced peak {peak / 1e6:.1f} MB = {peak / 1e3 / kloc:.0f} kB/KLOC')
+    print(f'peak RSS growth {rss / 1e3:.1f} MB = {rss / kloc:.0f} kB/KLOC')
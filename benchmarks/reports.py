@@ -0,0 +1,48 @@
+# A library making N warnings at nesting depth D, included by K files.
+#   python benchmarks/reports.py [N D K ...]
+# RSS is the peak of the whole process, so cases are compared one per run.
+from generate import write_doch
+from pymaniascript.compiler.parser import Parser
+from pymaniascript.msobjects import TypeUniverse
+import os
+import resource
+import sys
+import tempfile
+import time
+
+def library (warnings, depth, per_function=50):
+    lines = list()
+    for i in range(warnings // per_function):
+        body = [ f'  V + {j};' for j in range(per_function - 1) ]
+        for d in range(depth):
+            body = [ f'  if (V == {d}) {{' ] + [ '  ' + line for line in body ] + [ '  }' ]
+        lines += [ f'Integer F{i} (Integer A{i}) {{', '  declare Integer V = 0;', *body, '  return V;', '}' ]
+    return '\n'.join(lines)
+
+args = list(map(int, sys.argv[1:])) or [5000, 1, 20, 5000, 8, 20, 5000, 40, 20, 20000, 8, 50]
+
+with tempfile.TemporaryDirectory() as folder:
+    write_doch(os.path.join(folder, 'doc.h'), 0)
+    universe = TypeUniverse(os.path.join(folder, 'doc.h'))
+    universe.classes.load()
+
+    for warnings, depth, includers in zip(args[0::3], args[1::3], args[2::3]):
+        root = os.path.join(folder, f'Scripts{warnings}_{depth}_{includers}')
+        os.makedirs(os.path.join(root, 'Libs'))
+        with open(os.path.join(root, 'Libs', 'W.Script.txt'), 'w') as f: f.write(library(warnings, depth))
+        for k in range(includers):
+            with open(os.path.join(root, f'M{k}.Script.txt'), 'w') as f: f.write('#Include "Libs/W.Script.txt" as W\nmain() { }\n')
+
+        parser = Parser(root, universe)
+        start = time.perf_counter()
+        prog = parser.parse_file('Libs/W.Script.txt')
+        parsed = time.perf_counter()
+        count = len(prog.reports)
+        reported = time.perf_counter()
+        for k in range(includers):
+            assert len(parser.parse_file(f'M{k}.Script.txt').reports) == count
+        included = time.perf_counter()
+
+        print(f'N={warnings:<6d} D={depth:<3d} K={includers:<3d} {count} reports, parse {parsed - start:.3f}s, '
+              f'reports {1e3 * (reported - parsed):.2f}ms, includers {1e3 * (included - reported):.1f}ms, '
+              f'RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB')
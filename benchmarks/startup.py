@@ -0,0 +1,33 @@
+# Times the command line tool in fresh processes, best of 5, without and with
+# the parser tables cached in compiler/parser.cache.
+#   python benchmarks/startup.py
+from generate import write_doch
+from pymaniascript.compiler.tables import get_tables_filename
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+def run (args, cached):
+    best = None
+    for _ in range(5):
+        if cached == False and os.path.exists(get_tables_filename()): os.remove(get_tables_filename())
+        start = time.perf_counter()
+        subprocess.run([ sys.executable, '-m', 'pymaniascript.compiler', *args ], capture_output=True, check=True)
+        duration = time.perf_counter() - start
+        best = duration if best == None else min(best, duration)
+    return best
+
+with tempfile.TemporaryDirectory() as folder:
+    write_doch(os.path.join(folder, 'doc.h'), 0)
+    os.makedirs(os.path.join(folder, 'Scripts'))
+    with open(os.path.join(folder, 'Scripts', 'Main.Script.txt'), 'w') as f:
+        f.write('#Include "MathLib" as ML\nmain() {\n\tdeclare Integer I = ML::Abs(-1);\n\tlog(I);\n}\n')
+
+    commands = { 'compiler -h'             : [ '-h' ],
+                 'compiler -ew script'     : [ '-ew', '-d', os.path.join(folder, 'doc.h'),
+                                               os.path.join(folder, 'Scripts', 'Main.Script.txt') ] }
+    for name, args in commands.items():
+        cold, warm = run(args, False), run(args, True)
+        print(f'{name:24s} no cache {cold:6.3f}s  cached {warm:6.3f}s')
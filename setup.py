@@ -1,8 +1,13 @@
 from setuptools import setup, find_packages
+import re
+
+# The version is also part of the doc.h cache key, so it is only written in the package
+with open('src/pymaniascript/__init__.py') as f:
+    version = re.search(r"__version__ = '(.*)'", f.read()).group(1)
 
 setup(
     name='pymaniascript',
-    version='0a1',
+    version=version,
     description='Library that computes ASTs for Maniascript scripts.',
     author='MrLag',
     license='MIT',
@@ -2,4 +2,6 @@ print("""\
 This is the pymaniascript main package. Usage:
 \tpython -m pymaniascript.doch
 \tpython -m pymaniascript.compiler
+\tpython -m pymaniascript.daemon
+\tpython -m pymaniascript.client
 """, end='')
\ No newline at end of file
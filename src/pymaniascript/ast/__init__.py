@@ -1,37 +1,51 @@
 from pymaniascript.msobjects import *
-from .report import FATAL_ERROR, ERROR, WARNING, reporter
+from .report import FATAL_ERROR, ERROR, WARNING, Diagnostics, reporter
 from pymaniascript.scope import Scope
+from bisect import bisect_right
+import re
+
+class Lines:
+    
+    NEWLINE = re.compile('\n')
+    
+    def __init__ (self, text):
+        self.starts = [0] + [match.end() for match in Lines.NEWLINE.finditer(text)]
+    
+    def position (self, index):
+        ln = bisect_right(self.starts, index)
+        return ln, index - self.starts[ln-1] + 1
+    
+    def get_index (self, index):
+        return Index(index, self)
 
 class Index:
     
-    def __init__ (self, index, text):
+    def __init__ (self, index, lines):
         self.index = index
-        self.ln = text.count('\n', 0, index) + 1
-        self.col = index - text.rfind('\n', 0, index)
+        self.ln, self.col = lines.position(index)
     
     def __str__ (self):
         return f'[{self.ln}, {self.col}]'
 
+# Nodes do not keep reports, every report of a file goes to its diagnostics
 class ASTNode:
     
+    __slots__ = ('children', 'start', 'end', 'lines')
+    
     def __init__ (self, children, p):
         first = p[0]
         last = p[-1]
         if isinstance(first, list): first = first[0]
         if isinstance(last , list): last  = last [0]
-        self.children, self.start, self.end = children, first.start, last.end
-        
-        self.reports = list()
-        for child in children:
-            self.reports.extend(child.reports)
+        self.children, self.start, self.end, self.lines = children, first.start, last.end, last.lines
     
     def str (self, i=0, data=None):
         res = ''
         
         if data != None:
-            res += '| '*i + f'+ {self.start} - {self.end} {self.__class__.__name__}: {repr(data)}\n'
+            res += '| '*i + f'+ {self.get_start()} - {self.get_end()} {self.__class__.__name__}: {repr(data)}\n'
         else:
-            res += '| '*i + f'+ {self.start} - {self.end} {self.__class__.__name__}\n'
+            res += '| '*i + f'+ {self.get_start()} - {self.get_end()} {self.__class__.__name__}\n'
         
         for child in self.children:
             res += f'{child.str(i+1)}\n'
@@ -41,12 +55,20 @@ class ASTNode:
     def __str__ (self):
         return self.str()
     
+    def get_start (self):
+        return self.lines.get_index(self.start)
+    
+    def get_end (self):
+        return self.lines.get_index(self.end)
+    
 # ---
 
 class ASTTerminal (ASTNode):
     
+    __slots__ = ('content',)
+    
     def __init__ (self, p, content):
-        super().__init__(list(), [p])
+        super().__init__((), [p])
         self.content = content
     
     def str (self, i=0, data=None):
@@ -54,6 +76,8 @@ class ASTTerminal (ASTNode):
 
 class ASTTerminalValue (ASTTerminal):
     
+    __slots__ = ('value', 'type')
+    
     def __init__(self, p, value):
         super().__init__(p, value)
         self.value = value
@@ -61,15 +85,19 @@ class ASTTerminalValue (ASTTerminal):
 
 class ASTTerminalEmpty (ASTTerminal):
     
+    __slots__ = ()
+    
     class Empty:
         
-        def __init__ (self, pos):
-            self.start, self.end = pos, pos
+        __slots__ = ('start', 'end', 'lines')
+        
+        def __init__ (self, pos, lines):
+            self.start, self.end, self.lines = pos, pos, lines
     
-    def __init__ (self, last_token_end):
-        super().__init__(ASTTerminalEmpty.Empty(last_token_end), None)
+    def __init__ (self, last_token_end, lines):
+        super().__init__(ASTTerminalEmpty.Empty(last_token_end, lines), None)
     
-EMPTY = ASTTerminalEmpty(Index(0, ''))
+EMPTY = ASTTerminalEmpty(0, Lines(''))
 ASTTerminalEmpty.EMPTY = EMPTY
 del EMPTY
 
@@ -77,6 +105,8 @@ del EMPTY
 
 class ASTVector (ASTNode):
     
+    __slots__ = ('type', 'value')
+    
     def __init__ (self, p, elements, reporter):
         super().__init__(elements, p)
         types = [element.type for element in elements]
@@ -93,9 +123,9 @@ class ASTVector (ASTNode):
                 self.type = VEC3
         
         if self.type == VOID:
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Invalid types in vector.'
-            ))
+            )
         
         self.value = MSValue('@VECTOR', self.type)
 
@@ -103,6 +133,8 @@ class ASTVector (ASTNode):
 
 class ASTExpressionBinaryOperation (ASTNode):
     
+    __slots__ = ('type', 'left', 'operation', 'right', 'value')
+    
     def __init__(self, p, left, operation, right, reporter):
         super().__init__([left, operation, right], p)
         self.type = VOID
@@ -188,14 +220,16 @@ class ASTExpressionBinaryOperation (ASTNode):
                 self.type = BOOLEAN
         
         if self.type == VOID:
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Operation \'{op}\' on incompatible type.'
-            ))
+            )
         
         self.value = MSValue('@BINOP', self.type, True)
 
 class ASTExpressionUnaryOperation (ASTNode):
     
+    __slots__ = ('type', 'operation', 'right', 'value')
+    
     def __init__(self, p, operation, right, reporter):
         super().__init__([operation, right], p)
         self.type = VOID
@@ -212,9 +246,9 @@ class ASTExpressionUnaryOperation (ASTNode):
                 self.type = right.type
         
         if self.type == VOID:
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Operation \'{op}\' on incompatible type.'
-            ))
+            )
         
         self.value = MSValue('@UNIOP', self.type, True)
 
@@ -222,15 +256,17 @@ class ASTExpressionUnaryOperation (ASTNode):
 
 class ASTFunctionCall (ASTNode):
     
+    __slots__ = ('type', 'value')
+    
     def __init__(self, p, function, arguments, reporter):
         super().__init__([function, *arguments], p)
         
         fobj = function.value
         sign = fobj.valid_signature([arg.type for arg in arguments])
         if sign == None:
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Invalid arguments for function \'{fobj.name}\''
-            ))
+            )
             self.type = VOID
         else:
             self.type = sign
@@ -241,19 +277,21 @@ class ASTFunctionCall (ASTNode):
 
 class ASTArray (ASTNode):
     
+    __slots__ = ('type', 'value')
+    
     def __init__(self, p, array, index, reporter):
         super().__init__([array, index], p)
         
         if not isinstance(array.type, MSArray):
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'\'{array.value.name}\' is not an array.'
-            ))
+            )
             self.type = VOID
         
         elif not index.type.is_type(array.type.keytype):
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Invalid index type. Expected \'{array.type.keytype.name}\' but got \'{index.type.name}\''
-            ))
+            )
             self.type = array.type.elemtype
         
         else:
@@ -265,6 +303,8 @@ class ASTArray (ASTNode):
 
 class ASTDot (ASTNode):
     
+    __slots__ = ('parent', 'value', 'type')
+    
     def __init__(self, p, parent, child):
         super().__init__([parent, child], p)
         
@@ -273,6 +313,8 @@ class ASTDot (ASTNode):
 
 class ASTNamespace (ASTNode):
     
+    __slots__ = ('namespace', 'value', 'type')
+    
     def __init__ (self, p, namespace, obj):
         super().__init__([namespace, obj], p)
         
@@ -281,6 +323,8 @@ class ASTNamespace (ASTNode):
 
 class ASTEnum (ASTNode):
     
+    __slots__ = ('parent', 'value', 'type')
+    
     def __init__ (self, p, parent, enum_value):
         super().__init__([parent, enum_value], p)
         
@@ -291,12 +335,16 @@ class ASTEnum (ASTNode):
 
 class ASTKeyElem (ASTNode):
     
+    __slots__ = ('key', 'elem')
+    
     def __init__(self, p, elem, key):
         super().__init__([key, elem], p)
         self.key, self.elem = key, elem
 
 class ASTArrayDef (ASTNode):
     
+    __slots__ = ('type', 'value')
+    
     def __init__(self, p, elements, reporter):
         super().__init__(elements, p)
         self.type = None
@@ -333,15 +381,15 @@ class ASTArrayDef (ASTNode):
                 
                 key_valid = [ktype.is_type(keytype) for ktype in keytypes]
                 if False in key_valid:
-                    self.reports.append(reporter(
+                    reporter(
                         ERROR, self, f'Every key must have type {elemtype.name}.'
-                    ))
+                    )
                 
                 elem_valid = [etype.is_type(elemtype) for etype in elemtypes]
                 if False in elem_valid:
-                    self.reports.append(reporter(
+                    reporter(
                         ERROR, self, f'Every element must have type {elemtype.name}.'
-                    ))
+                    )
                 
                 self.type = get_array(elemtype, keytype)
             
@@ -362,18 +410,18 @@ class ASTArrayDef (ASTNode):
                 
                 elem_valid = [etype.is_type(elemtype) for etype in elemtypes]
                 if False in elem_valid:
-                    self.reports.append(reporter(
+                    reporter(
                         ERROR, self, f'Every element must have type {elemtype.name}.'
-                    ))
+                    )
                 
                 self.type = get_array(elemtype)
         
         if self.type == None: self.type = VOID
         
         if isinstance(self.type, MSArray) and self.type.associative == True and isinstance(self.type.keytype, MSArray):
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Arrays cannot be indexers.'
-            ))
+            )
             
         
         self.value = MSValue('@ARRAYDEF', self.type, True)
@@ -382,6 +430,8 @@ class ASTArrayDef (ASTNode):
 
 class ASTTypeArray (ASTNode):
     
+    __slots__ = ('value',)
+    
     def __init__ (self, p, elemtype, keytype):
         children = [elemtype] + ([keytype] if keytype != None else [])
         super().__init__(children, p)
@@ -395,6 +445,8 @@ class ASTTypeArray (ASTNode):
 
 class ASTDeclare (ASTNode):
     
+    __slots__ = ('mode', 'type', 'name', '_as', '_for', 'assign', '_value', 'value')
+    
     def __init__ (self, p, mode, type, name, _as, _for, assign, value, reporter, glob=False):
         super().__init__([mode, type, name, _as, _for, assign, value], p)
         
@@ -410,50 +462,50 @@ class ASTDeclare (ASTNode):
             self.name = self._as
         
         if glob == True and self._value != None:
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Global variables have no initial value.'
-            ))
+            )
                    
         if self.type == None and (self._value == None or value.type.has_any() or value.type.has_null()):
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Unable to determine type.'
-            ))
+            )
             self.type = VOID
         elif self.type != None and self._value != None and not self._value.is_type(self.type):
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Incompatible types in declare.'
-            ))
+            )
         elif self.type == None:
             self.type = self._value.type
         
         if self._for != None and not isinstance(self._for.type, MSClass):
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Declare \'for\' requires a class.'
-            ))
+            )
         
         def valid_type (root):
             if root == VOID:
-                self.reports.append(reporter(
+                reporter(
                     ERROR, self, f'Invalid type in declaration.'
-                ))
+                )
             elif isinstance(root, MSArray):
                 valid_type(root.elemtype)
         valid_type(self.type)
         
         if glob == True and not self.name.startswith('G_'):
-            self.reports.append(reporter(
+            reporter(
                 WARNING, self, f'Global varibale \'{self.name}\' should start with \'G_\''
-            ))
+            )
         
         if self.mode == 'persistent' and not self.name.startswith('P_') and not self.name.startswith('Persistent_'):
-            self.reports.append(reporter(
+            reporter(
                 WARNING, self, f'Persistent varibale \'{self.name}\' should start with \'P_\' or \'Persistent_\''
-            ))
+            )
         
         if (self.mode == 'netread' or self.mode == 'netwrite') and not self.name.startswith('Net_'):
-            self.reports.append(reporter(
+            reporter(
                 WARNING, self, f'Net varibale \'{self.name}\' should start with \'Net_\''
-            ))
+            )
         
         self.value = MSValue(self.name, self.type)
 
@@ -461,32 +513,38 @@ class ASTDeclare (ASTNode):
 
 class ASTBlock (ASTNode):
     
+    __slots__ = ('statements',)
+    
     def __init__ (self, p, statements):
         super().__init__(statements, p)
         self.statements = statements
 
 class ASTFor (ASTNode):
     
+    __slots__ = ('iterator', '_start', '_end', 'step', 'block')
+    
     def __init__(self, p, iterator, start, end, step, block, reporter):
         super().__init__([iterator, start, end, step, block], p)
         
         self.iterator, self._start, self._end, self.step, self.block = iterator, start, end, step, block
         
         if self._start.type != INTEGER:
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Start must be an integer.'
-            ))
+            )
         if self._end.type != INTEGER:
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'End must be an integer.'
-            ))
+            )
         if not isinstance(self.step, ASTTerminalEmpty) and self.step.type != INTEGER:
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Step must be an integer.'
-            ))
+            )
 
 class ASTForEach (ASTNode):
     
+    __slots__ = ('iterator', 'array', 'block')
+    
     def __init__ (self, p, iterator, array, block):
         super().__init__([iterator, array, block], p)
         
@@ -494,30 +552,36 @@ class ASTForEach (ASTNode):
 
 class ASTIfElse (ASTNode):
     
+    __slots__ = ('condition', 'ifblock', 'elseblock')
+    
     def __init__ (self, p, condition, ifblock, elseblock, reporter):
         super().__init__([condition, ifblock, elseblock], p)
         
         self.condition, self.ifblock, self.elseblock = condition, ifblock, elseblock
         if self.condition.type != BOOLEAN:
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Condition must be a boolean.'
-            ))
+            )
 
 class ASTWhile (ASTNode):
     
+    __slots__ = ('condition', 'block')
+    
     def __init__ (self, p, condition, block, reporter):
         super().__init__([condition, block], p)
         
         self.condition, self.block = condition, block
         if self.condition.type != BOOLEAN:
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Condition must be a boolean.'
-            ))
+            )
 
 # ---
 
 class ASTStructAssign (ASTNode):
     
+    __slots__ = ('name', 'value', 'type')
+    
     def __init__ (self, p, name, value):
         super().__init__([name, value], p)
         self.name = name.content
@@ -525,6 +589,8 @@ class ASTStructAssign (ASTNode):
 
 class ASTStructCall (ASTNode):
     
+    __slots__ = ('struct', 'type', 'value')
+    
     def __init__ (self, p, struct, assigns, reporter):
         super().__init__([struct, *assigns], p)
         
@@ -534,20 +600,20 @@ class ASTStructCall (ASTNode):
         
         for assign in assigns:
             if assign.name in assigns_test:
-                self.reports.append(reporter(
+                reporter(
                     ERROR, self, f'Attribute \'{assign.name}\' set up multiple times.'
-                ))
+                )
             
             struct_val = self.struct.get_attribute(assign.name)
             if struct_val == None:
-                self.reports.append(reporter(
+                reporter(
                     ERROR, self, f'Struct \'{self.struct.name}\' has no attribute \'{assign.name}\'.'
-                ))
+                )
             
             if not assign.type.is_type(struct_val.type):
-                self.reports.append(reporter(
+                reporter(
                     ERROR, self, f'\'{assign.name}\' has wrong type. Expected \'{struct_val.type.name}\' but got \'{assign.type.name}\'.'
-                ))
+                )
             
             assigns_test.append(assign.name)
         
@@ -557,6 +623,8 @@ class ASTStructCall (ASTNode):
 
 class ASTSwitch (ASTNode):
     
+    __slots__ = ('expression', 'cases', 'default', 'mode')
+    
     def __init__ (self, p, expression, cases, default, mode, reporter):
         super().__init__([expression, *cases, default], p)
         self.expression, self.cases, self.default = expression, cases, default
@@ -567,17 +635,19 @@ class ASTSwitch (ASTNode):
             for case in cases:
                 for value in case.values:
                     if type != value.type:
-                        self.reports.append(reporter(
+                        reporter(
                             ERROR, self, f'Wrong type in case. Found \'{value.type.name}\' instead of \'{type.name}\'.'
-                        ))
+                        )
         elif mode == 1:
             if not isinstance(self.expression.type, MSClass):
-                self.reports.append(reporter(
+                reporter(
                     ERROR, self, f'\'{self.expression.value.name}\' must be a class type.'
-                ))
+                )
 
 class ASTCase (ASTNode):
     
+    __slots__ = ('values', 'block')
+    
     def __init__ (self, p, values, block):
         super().__init__([*values, block], p)
         self.values = [value.value for value in values]
@@ -585,6 +655,8 @@ class ASTCase (ASTNode):
 
 class ASTDefault (ASTCase):
     
+    __slots__ = ()
+    
     def __init__ (self, p, block):
         super().__init__(p, [], block)
 
@@ -592,6 +664,8 @@ class ASTDefault (ASTCase):
 
 class ASTLabelCall (ASTNode):
     
+    __slots__ = ('name', 'mode')
+    
     def __init__ (self, p, name, mode):
         super().__init__([name, mode], p)
         self.name = name.content
@@ -601,19 +675,21 @@ class ASTLabelCall (ASTNode):
 
 class ASTAssign (ASTNode):
     
+    __slots__ = ('receiver', 'assign', 'value')
+    
     def __init__ (self, p, receiver, assign, value, reporter):
         super().__init__([receiver, assign, value], p)
         self.receiver, self.assign, self.value = receiver, assign, value
         
         if receiver.value.const:
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Trying to change \'{self.receiver.value.name}\' which is constant.'
-            ))
+            )
         
         def wrong_type ():
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Setting \'{self.receiver.value.name}\' with incompatible types or operation.'
-            ))
+            )
         
         op = assign.content
         if op == '=':
@@ -673,21 +749,29 @@ class ASTAssign (ASTNode):
 
 class ASTYield (ASTNode):
     
+    __slots__ = ()
+    
     def __init__(self, p):
-        super().__init__([], p)
+        super().__init__((), p)
 
 class ASTContinue (ASTNode):
     
+    __slots__ = ()
+    
     def __init__(self, p):
-        super().__init__([], p)
+        super().__init__((), p)
 
 class ASTBreak (ASTNode):
     
+    __slots__ = ()
+    
     def __init__(self, p):
-        super().__init__([], p)
+        super().__init__((), p)
 
 class ASTReturn (ASTNode):
     
+    __slots__ = ('value',)
+    
     def __init__(self, p, value):
         super().__init__([value], p)
         self.value = value.value
@@ -696,6 +780,8 @@ class ASTReturn (ASTNode):
 
 class ASTInterpolatedString (ASTNode):
     
+    __slots__ = ('elements', 'value', 'type')
+    
     def __init__ (self, p, elements):
         super().__init__(elements, p)
         self.elements = elements
@@ -707,6 +793,8 @@ class ASTInterpolatedString (ASTNode):
 
 class ASTFunctionDefinition (ASTNode):
     
+    __slots__ = ('type', 'name', 'block', 'args')
+    
     def __init__ (self, p, type, name, args, block, reporter, main=False):
         children = [type, name, *args, block] if not main else [name, *args, block]
         super().__init__(children, p)
@@ -717,9 +805,9 @@ class ASTFunctionDefinition (ASTNode):
         
         for _, argname in self.args:
             if not argname.startswith('_'):
-                self.reports.append(reporter(
+                reporter(
                     WARNING, self, f'Argument \'{argname}\' should start with \'_\''
-                ))
+                )
         
         def return_check (root):
             v = False
@@ -739,17 +827,17 @@ class ASTFunctionDefinition (ASTNode):
             elif isinstance(root, ASTReturn):
                 v = True
                 if not root.value.is_type(self.type):
-                    self.reports.append(reporter(
+                    reporter(
                         ERROR, self, f'Wrong return type.'
-                    ))
+                    )
             return v
         return_found = return_check(self.block)
         
         def valid_type (root):
             if root == VOID:
-                self.reports.append(reporter(
+                reporter(
                     ERROR, self, f'Invalid type in arguments.'
-                ))
+                )
             elif isinstance(root, MSArray):
                 valid_type(root.elemtype)
         
@@ -760,31 +848,37 @@ class ASTFunctionDefinition (ASTNode):
             valid_type(self.type)
         
         if return_found == False and self.type != VOID:
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Function \'{self.name}\' must return something.'
-            ))
+            )
 
 class ASTMain (ASTFunctionDefinition):
     
+    __slots__ = ()
+    
     def __init__(self, p, void_type, name, block):
         super().__init__(p, void_type, name, [], block, True)
 
 class ASTLabelDef (ASTNode):
     
-    def __init__ (self, p, name, block):
+    __slots__ = ('name', 'block', 'value')
+    
+    def __init__ (self, p, name, block, reporter):
         super().__init__([name, block], p)
         self.name, self.block = name.content, block
         self.value = MSLabel(self.name)
-        self.reports = list()
+        reporter.discard(self.start)
 
 # ---
 
 class ASTProg (ASTNode):
     
+    __slots__ = ('directives', 'definitions', 'main', 'scope', 'diagnostics', 'dependencies', 'key')
+    
     def __init__ (self, p, directives, definitions, main, scope, reporter):
         super().__init__([*directives, *definitions, main], p)
         self.directives, self.definitions, self.main = directives, definitions, main
-        self.scope = scope
+        self.scope, self.diagnostics = scope, reporter
         
         directives_counter = { root_type: 0 for root_type in [ASTDirectiveConst  , ASTDirectiveConstFromInclude ,
                                                               ASTDirectiveStruct , ASTDirectiveStructFromInclude,
@@ -797,26 +891,36 @@ class ASTProg (ASTNode):
         directives_counter[ASTDirectiveStruct] += directives_counter[ASTDirectiveStructFromInclude]
         
         if directives_counter[ASTDirectiveExtends] >= 2:
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'There must be at most one \'#Extends\'.'
-            ))
+            )
         
         if directives_counter[ASTDirectiveExtends] >= 1 and isinstance(self.main, ASTMain):
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Scripts with \'#Extends\' cannot have a \'main\'.'
-            ))
+            )
+
+    @property
+    def reports (self):
+        return self.diagnostics.get_reports()
 
+# Only reports the error, with diagnostics of its own
 class ASTProgError (ASTProg):
     
+    __slots__ = ()
+    
     def __init__ (self, error_msg, reporter, offender=None):
+        reporter = Diagnostics(reporter.filename)
         super().__init__([ASTTerminalEmpty.EMPTY], [], [], ASTTerminalEmpty.EMPTY, Scope(), reporter)
         offender = offender or self
-        self.reports.append(reporter(FATAL_ERROR, offender, error_msg))
+        reporter(FATAL_ERROR, offender, error_msg)
         
 # ---
 
 class ASTDirectiveConst (ASTNode):
     
+    __slots__ = ('name', 'value')
+    
     def __init__ (self, p, name, value):
         super().__init__([name, value], p)
         self.name = name.content
@@ -824,6 +928,8 @@ class ASTDirectiveConst (ASTNode):
 
 class ASTDirectiveConstFromInclude (ASTNode):
     
+    __slots__ = ('name', 'value')
+    
     def __init__ (self, p, obj, name):
         super().__init__([obj, name], p)
         self.name = name.content
@@ -831,6 +937,8 @@ class ASTDirectiveConstFromInclude (ASTNode):
 
 class ASTDirectiveStruct (ASTNode):
     
+    __slots__ = ('name', 'struct')
+    
     def __init__ (self, p, name, args):
         super().__init__([name, *args], p)
         self.name = name.content
@@ -839,6 +947,8 @@ class ASTDirectiveStruct (ASTNode):
 
 class ASTDirectiveStructFromInclude (ASTNode):
     
+    __slots__ = ('name', 'struct')
+    
     def __init__ (self, p, obj, name):
         super().__init__([obj, name], p)
         self.name = name.content
@@ -847,6 +957,8 @@ class ASTDirectiveStructFromInclude (ASTNode):
 
 class ASTDirectiveInclude (ASTNode):
     
+    __slots__ = ('filepath', 'name', 'prog', 'include')
+    
     def __init__ (self, p, filepath, name, prog, reporter, from_doch=False):
         super().__init__([filepath, name], p)
         self.filepath = filepath.content
@@ -855,9 +967,9 @@ class ASTDirectiveInclude (ASTNode):
         self.include = MSInclude(self.name, self.prog.scope) if not from_doch else prog
         
         if self.prog != None and isinstance(self.prog.main, ASTMain):
-            self.reports.append(reporter(
+            reporter(
                 ERROR, self, f'Include \'{self.name}\' should not contain a \'main\'.'
-            ))
+            )
         
         if not from_doch:
             directives_counter = { root_type: 0 for root_type in [ASTDirectiveConst  , ASTDirectiveConstFromInclude ,
@@ -872,29 +984,34 @@ class ASTDirectiveInclude (ASTNode):
             
             if directives_counter[ASTDirectiveExtends] >= 1 or directives_counter[ASTDirectiveRequireContext] >=1 or \
             directives_counter[ASTDirectiveSetting] >= 1 or directives_counter[ASTDirectiveCommand] >= 1:
-                self.reports.append(reporter(
+                reporter(
                     ERROR, self, f'Include \'{self.name}\' should not have any diractives besides \'#Include\', \'#Const\' and \'#Struct\'.'
-                ))
+                )
         
         if not from_doch:
-            self.reports.extend(self.prog.reports)
+            reporter.include(self.prog.diagnostics)
 
 class ASTDirectiveRequireContext (ASTNode):
     
+    __slots__ = ('_class',)
+    
     def __init__(self, p, _class):
         super().__init__([_class], p)
         self._class = _class
 
 class ASTDirectiveExtends (ASTNode):
     
+    __slots__ = ('filepath', 'prog')
+    
     def __init__ (self, p, filepath, prog):
         super().__init__([filepath], p)
         self.filepath = filepath.content
         self.prog = prog
-        self.reports.extend(self.prog.reports)
 
 class ASTDirectiveSetting (ASTNode):
     
+    __slots__ = ('name', 'showed_name', 'value')
+    
     def __init__ (self, p, name, value, showed_name):
         super().__init__([name, value, showed_name], p)
         self.name = name.content
@@ -903,6 +1020,8 @@ class ASTDirectiveSetting (ASTNode):
 
 class ASTDirectiveCommand (ASTNode):
     
+    __slots__ = ('name', 'showed_name', 'value')
+    
     def __init__ (self, p, name, type, showed_name):
         super().__init__([name, type, showed_name], p)
         self.name = name.content
@@ -11,13 +11,59 @@ WARNING = ReportType.WARNING
 
 class Report:
     
+    __slots__ = ('filename', 'level', 'offender', 'msg')
+    
     def __init__ (self, filename, level, offender, msg):
         self.filename, self.level, self.offender, self.msg = filename, level, offender, msg
     
     def __str__ (self):
-        return f'{self.filename} ({self.level.name}) {self.offender.start} - {self.offender.end}: {self.msg}'
+        return f'{self.filename} ({self.level.name}) {self.offender.get_start()} - {self.offender.get_end()}: {self.msg}'
+
+# Every report made while compiling a file, in the order of the nodes they
+# are about. Nodes are built after everything they contain, so the last
+# reports made are the ones of the nodes starting at or after some position.
+# Included files keep their own diagnostics, which are added as a whole and
+# only flattened (once) when the reports are asked for.
+class Diagnostics:
+    
+    __slots__ = ('filename', 'entries', 'reports')
+    
+    def __init__ (self, filename):
+        self.filename, self.entries, self.reports = filename, list(), None
+    
+    # A report about a node built after the ones it comes before (like a
+    # function after its arguments) goes before the reports made from 'before'
+    def __call__ (self, level, offender, msg, before=None):
+        report = Report(self.filename, level, offender, msg)
+        index = self.__find(before) if before != None else len(self.entries)
+        self.entries.insert(index, report)
+        self.reports = None
+        return report
+    
+    def include (self, diagnostics):
+        self.entries.append(diagnostics)
+        self.reports = None
+    
+    def discard (self, start):
+        del self.entries[self.__find(start):]
+        self.reports = None
+    
+    def __find (self, start):
+        index = len(self.entries)
+        while index != 0 and isinstance(self.entries[index-1], Report) and self.entries[index-1].offender.start >= start:
+            index -= 1
+        return index
+    
+    def get_reports (self):
+        if self.reports == None:
+            reports = list()
+            for entry in self.entries:
+                if isinstance(entry, Report):
+                    reports.append(entry)
+                else:
+                    reports.extend(entry.get_reports())
+            self.reports = reports
+        return self.reports
 
 def reporter (filename):
-    def report_gen (level, offender, msg):
-        return Report(filename, level, offender, msg)
-    return report_gen
+    return Diagnostics(filename)
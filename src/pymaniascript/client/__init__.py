@@ -0,0 +1,51 @@
+import json
+import socket
+
+# Talks to a 'pymaniascript.daemon' listening on a Unix socket. Only the
+# standard library is imported, so a client starts fast.
+class Client:
+
+    def __init__ (self, path):
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(path)
+        self.file = self.socket.makefile('rwb')
+        self.next_id = 0
+
+    def __enter__ (self):
+        return self
+
+    def __exit__ (self, *exc):
+        self.close()
+
+    def close (self):
+        self.file.close()
+        self.socket.close()
+
+    def call (self, method, **params):
+        self.next_id += 1
+        request = { 'jsonrpc': '2.0', 'id': self.next_id, 'method': method, 'params': params }
+        self.file.write(json.dumps(request).encode() + b'\n')
+        self.file.flush()
+
+        line = self.file.readline()
+        if line == b'':
+            raise Exception('The daemon closed the connection.')
+        response = json.loads(line)
+        if 'error' in response:
+            raise Exception(f'{response["error"]["message"]} ({response["error"]["code"]})')
+        return response['result']
+
+    def compile (self, file, ast=False):
+        return self.call('compile', file=file, ast=ast)
+
+    def reports (self, file):
+        return self.call('reports', file=file)
+
+    def refresh (self):
+        return self.call('refresh')
+
+    def stats (self):
+        return self.call('stats')
+
+    def shutdown (self):
+        return self.call('shutdown')
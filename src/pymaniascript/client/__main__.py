@@ -0,0 +1,46 @@
+import os
+import json
+import argparse
+
+parser = argparse.ArgumentParser(prog='\n  python -m pymaniascript.client',
+                                 formatter_class=argparse.RawDescriptionHelpFormatter,
+                                 description='description:\n  Asks a running \'pymaniascript.daemon\' to compile scripts and prints their reports.',
+                                 epilog='The daemon must have been started with a socket:\n  python -m pymaniascript.daemon -s socket rootfolder')
+
+parser.add_argument('scriptfile'    , help='Path to your scripts (relative to the root folder of the daemon, or absolute)', nargs='*')
+parser.add_argument('-s', help='Path of the Unix socket of the daemon', metavar='socket', dest='socket', required=True)
+parser.add_argument('-e', help='Also prints errors generated by the AST', action='store_true', dest='errors')
+parser.add_argument('-w', help='Also prints warnings generated by the AST (forces -e)', action='store_true', dest='warnings')
+parser.add_argument('-a', help='Also prints the AST', action='store_true', dest='ast')
+parser.add_argument('--stats', help='Prints the statistics of the daemon', action='store_true', dest='stats')
+parser.add_argument('--shutdown', help='Stops the daemon', action='store_true', dest='shutdown')
+args = parser.parse_args()
+
+warnings = args.warnings
+errors = args.errors or warnings
+
+from . import Client
+
+try:
+    client = Client(args.socket)
+except OSError as e:
+    print(f'Could not connect to \'{args.socket}\': {e}')
+    exit(1)
+
+errored = False
+with client:
+    for file in args.scriptfile:
+        file = os.path.abspath(file) if os.path.exists(file) else file
+        result = client.compile(file, args.ast)
+        errored = errored or result['errors'] != 0
+        
+        if args.ast: print(result['ast'])
+        print(f'{result["file"]}: {result["errors"]} error(s), {result["warnings"]} warning(s) ({result["duration"] * 1000:.1f}ms)')
+        for report in result['reports']:
+            if (report['level'] in ['ERROR', 'FATAL_ERROR'] and errors) or (report['level'] == 'WARNING' and warnings):
+                print(f'  {report["file"]} ({report["level"]}) [{report["start"][0]}, {report["start"][1]}] - [{report["end"][0]}, {report["end"][1]}]: {report["message"]}')
+    
+    if args.stats: print(json.dumps(client.stats(), indent=1))
+    if args.shutdown: client.shutdown()
+
+exit(1 if errored else 0)
@@ -1,4 +1,12 @@
 from .parser import Parser
+from .lexer import Lexer
+from .files import FileCache
+from .graph import DependencyGraph
+from .batch import compile_batch
+from .aio import compile_async
 
-def compile (filepath, root_folder):
-    return Parser(root_folder).parse_file(filepath)
\ No newline at end of file
+def compile (filepath, root_folder, universe=None, cache_dir=None):
+    return Parser(root_folder, universe, cache_dir=cache_dir).parse_file(filepath)
+
+def iter_tokens (text, universe=None):
+    return Lexer(universe).iter_tokens(text)
\ No newline at end of file
@@ -1,21 +1,59 @@
 import os
+import time
 import argparse
 from pymaniascript.ast.report import FATAL_ERROR, ERROR, WARNING
 
 parser = argparse.ArgumentParser(prog='\n  python -m pymaniascript.compiler',
                                  formatter_class=argparse.RawDescriptionHelpFormatter,
                                  description='description:\n  Computes and prints the abstract syntax tree (AST) of a maniascript script.',
-                                 epilog='Due to how the game handles file includes, the script needed to be compiled must be in a \'/Scripts\' folder.\nWhen handling big scripts, it is preferable to redirect the output to a file:\n  python -m pymaniascript.compiler [-ew] scriptfile > ast')
+                                 epilog='Due to how the game handles file includes, the script needed to be compiled must be in a \'/Scripts\' folder.\nWhen handling big scripts, it is preferable to redirect the output to a file:\n  python -m pymaniascript.compiler [-ew] [-d doch] [-c cachedir] scriptfile > ast\nTo check a whole folder using 4 processes:\n  python -m pymaniascript.compiler -b -j 4 [-ew] Scripts')
 
-parser.add_argument('scriptfile'    , help='Path to your script')
+parser.add_argument('scriptfile'    , help='Path to your script (with -b, any number of scripts, folders or glob patterns)', nargs='+')
 parser.add_argument('-e', help='Also prints errors generated by the AST', action='store_true', dest='errors')
 parser.add_argument('-w', help='Also prints warnings generated by the AST (forces -e)', action='store_true', dest='warnings')
+parser.add_argument('-d', help='Path to the \'doc.h\' to compile against (defaults to the one generated in pymaniascript.doch)', metavar='doch', dest='doch')
+parser.add_argument('-c', help='Folder where compiled files are cached between runs (defaults to $PYMANIASCRIPT_CACHE_DIR, disabled if unset)', metavar='cachedir', dest='cachedir')
+parser.add_argument('-b', help='Batch mode: compiles every script given and prints a line per script, its reports (with -e/-w) and a summary instead of the AST', action='store_true', dest='batch')
+parser.add_argument('-j', help='Number of processes used by the batch mode (defaults to the number of CPUs)', metavar='jobs', dest='jobs', type=int)
 args = parser.parse_args()
 
-filepath = args.scriptfile
 warnings = args.warnings
 errors = args.errors or warnings
 
+def print_batch ():
+    from .batch import compile_batch
+    
+    start = time.perf_counter()
+    files = lines = errored = error_count = warning_count = 0
+    for result in compile_batch(args.scriptfile, args.doch and os.path.abspath(args.doch), args.cachedir, args.jobs):
+        result_errors, result_warnings = result.count(ERROR, FATAL_ERROR), result.count(WARNING)
+        files, lines = files + 1, lines + result.lines
+        errored += result_errors != 0
+        error_count, warning_count = error_count + result_errors, warning_count + result_warnings
+        
+        print(f'{result.filepath}: {result_errors} error(s), {result_warnings} warning(s)')
+        for level, report in result.reports:
+            if (level in [ERROR, FATAL_ERROR] and errors) or (level == WARNING and warnings):
+                print(f'  {report}')
+    
+    duration = time.perf_counter() - start
+    print(f'\n{files} file(s), {lines} line(s) in {duration:.2f}s ({files / duration:.1f} files/s, {lines / duration:.0f} lines/s)')
+    print(f'{errored} file(s) with errors, {error_count} error(s), {warning_count} warning(s)')
+    exit(1 if errored != 0 else 0)
+
+if args.batch:
+    try:
+        print_batch()
+    except Exception as e:
+        print(e)
+        exit(1)
+
+if len(args.scriptfile) != 1:
+    print('You must provide a single file (or use -b)!')
+    exit()
+
+filepath = args.scriptfile[0]
+
 full_filepath = os.path.abspath(filepath)
 
 if not os.path.isfile(full_filepath):
@@ -36,11 +74,13 @@ if tail == '':
 
 else:
     from . import compile
+    from pymaniascript.msobjects import TypeUniverse
     
+    universe = TypeUniverse(os.path.abspath(args.doch)) if args.doch else None
     root_folder = os.path.join(head, 'Scripts')
     filepath = os.path.join(*tail_stack[-2::-1])
     
-    root = compile(filepath, root_folder)
+    root = compile(filepath, root_folder, universe, args.cachedir)
     
     print(root, end='')
     
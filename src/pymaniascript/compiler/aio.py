@@ -0,0 +1,48 @@
+from .parser import Parser, COMPUTED_FILES
+from .lexer import Lexer
+from .graph import get_directives, INCLUDE
+from .files import get_file_stat
+from pymaniascript.msobjects import UNIVERSE
+import asyncio
+import os
+
+# The files (and the includes they contain) are read concurrently first, so
+# that the compilation, in a thread of the executor, never waits on the disk
+def __load (universe):
+    universe.classes.load()
+
+def __read (universe, full_filename):
+    stat = get_file_stat(full_filename)
+    try:
+        with open(full_filename, 'r') as f: data = f.read()
+    except OSError:
+        return None, []
+
+    targets = [ target for kind, target in get_directives(Lexer(universe), data)
+                if kind != INCLUDE or target not in universe.namespaces ]
+    return (stat, data), targets
+
+def __compile (filepath, root_folder, universe, cache_dir, files, sources):
+    return Parser(root_folder, universe, cache_dir=cache_dir, files=files, sources=sources).parse_file(filepath)
+
+async def compile_async (filepath, root_folder, universe=None, cache_dir=None, files=None, executor=None, max_reads=8):
+    loop = asyncio.get_running_loop()
+    universe = universe if universe != None else UNIVERSE
+    files = files if files != None else COMPUTED_FILES
+    await loop.run_in_executor(executor, __load, universe)
+
+    sources, seen = dict(), set()
+    semaphore = asyncio.Semaphore(max_reads)
+
+    async def discover (filepath):
+        if filepath in seen: return
+        seen.add(filepath)
+
+        full_filename = root_folder + os.sep + filepath
+        async with semaphore:
+            source, targets = await loop.run_in_executor(executor, __read, universe, full_filename)
+        if source != None: sources[full_filename] = source
+        await asyncio.gather(*[ discover(target) for target in targets ])
+
+    await discover(filepath)
+    return await loop.run_in_executor(executor, __compile, filepath, root_folder, universe, cache_dir, files, sources)
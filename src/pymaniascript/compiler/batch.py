@@ -0,0 +1,110 @@
+from .parser import Parser
+from .graph import DependencyGraph, NAMESPACE
+from pymaniascript.ast.report import FATAL_ERROR
+from pymaniascript.msobjects import TypeUniverse, UNIVERSE
+from multiprocessing import Pool
+import glob
+import os
+import time
+
+__STATE = dict()
+
+class BatchResult:
+
+    def __init__ (self, root_folder, filepath, lines, reports, duration):
+        self.root_folder, self.filepath = root_folder, filepath
+        self.lines, self.reports, self.duration = lines, reports, duration
+
+    def count (self, *levels):
+        return sum( 1 for level, _ in self.reports if level in levels )
+
+def split_root (full_filepath, root_name='Scripts'):
+    head, tail = full_filepath, ''
+    tail_stack = []
+
+    while tail != root_name:
+        head, tail = os.path.split(head)
+        tail_stack.append(tail)
+        if tail == '': return None
+
+    return os.path.join(head, root_name), '/'.join(tail_stack[-2::-1])
+
+def find_scripts (paths, suffix='.Script.txt'):
+    filenames = list()
+    for path in paths:
+        if os.path.isdir(path):
+            found = glob.glob(os.path.join(glob.escape(path), '**', '*' + suffix), recursive=True)
+        elif os.path.isfile(path):
+            found = [ path ]
+        else:
+            found = sorted(glob.glob(path, recursive=True))
+        if len(found) == 0:
+            raise Exception(f'No script found in \'{path}\'.')
+        filenames.extend(found)
+
+    scripts = dict()
+    for filename in filenames:
+        split = split_root(os.path.abspath(filename))
+        if split == None:
+            raise Exception(f'Folder \'Scripts\' not found in hierarchy of \'{filename}\'.')
+        scripts.setdefault(split[0], set()).add(split[1])
+    return scripts
+
+# Files are sent in chunks ordered as a depth first walk of their includes, so
+# scripts sharing libraries end up in the same worker. A worker keeps its
+# compiled files between chunks, and includes are compiled before their
+# includers, so a library is only compiled once per worker.
+def schedule (scripts, universe=None, chunks=1):
+    ordered = list()
+    for root_folder, filepaths in sorted(scripts.items()):
+        graph = DependencyGraph(root_folder, universe)
+        graph.refresh(filepaths)
+
+        visited = set()
+        def visit (filepath):
+            if filepath in visited: return
+            visited.add(filepath)
+            for target, kind in graph.edges.get(filepath, dict()).items():
+                if kind != NAMESPACE: visit(target)
+            if filepath in filepaths: ordered.append((root_folder, filepath))
+
+        for filepath in sorted(filepaths):
+            visit(filepath)
+
+    size = max(1, -(-len(ordered) // chunks))
+    return [ ordered[i:i + size] for i in range(0, len(ordered), size) ]
+
+def __init_worker (doch, cache_dir):
+    if 'universe' not in __STATE or __STATE['doch'] != doch:
+        __STATE['universe'] = TypeUniverse(doch) if doch != None else UNIVERSE
+    __STATE['doch'], __STATE['cache_dir'] = doch, cache_dir
+
+def __compile_chunk (chunk):
+    results = list()
+    for root_folder, filepath in chunk:
+        start = time.perf_counter()
+        try:
+            with open(os.path.join(root_folder, filepath), 'r') as f: lines = f.read().count('\n') + 1
+            prog = Parser(root_folder, __STATE['universe'], cache_dir=__STATE['cache_dir']).parse_file(filepath)
+            reports = [ (report.level, str(report)) for report in prog.reports ]
+        except Exception as e:
+            lines, reports = 0, [(FATAL_ERROR, f'{filepath} ({FATAL_ERROR.name}): {type(e).__name__}: {e}')]
+        results.append(BatchResult(root_folder, filepath, lines, reports, time.perf_counter() - start))
+    return results
+
+def compile_batch (paths, doch=None, cache_dir=None, jobs=None):
+    jobs = jobs if jobs != None else os.cpu_count() or 1
+    __init_worker(doch, cache_dir)
+    scripts = find_scripts(paths)
+    chunks = schedule(scripts, __STATE['universe'], jobs * 4 if jobs > 1 else 1)
+
+    if jobs <= 1:
+        for chunk in chunks:
+            yield from __compile_chunk(chunk)
+        return
+
+    # Forked workers share the universe and parser tables loaded here
+    __STATE['universe'].classes.load()
+    with Pool(jobs, __init_worker, (doch, cache_dir)) as pool:
+        for results in pool.imap(__compile_chunk, chunks):
+            yield from results
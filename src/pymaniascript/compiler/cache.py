@@ -0,0 +1,157 @@
+from pymaniascript.ast import ASTProgError
+from pymaniascript.msobjects import MSClass, MSEnum, MSArray, MSInclude, get_array, NULL, VOID
+from pymaniascript.msobjects.msobject import MSObject
+import pymaniascript.msobjects as msobjects
+
+from hashlib import sha1
+from functools import partial
+import os
+import pickle
+import threading
+
+CACHE_DIR = os.environ.get('PYMANIASCRIPT_CACHE_DIR', None)
+
+__FORMAT   = 3
+__BUILTINS = { **{ name: obj for name, obj in vars(msobjects).items() if isinstance(obj, MSObject) },
+               '@NULL': NULL.type }
+__BUILTIN_IDS = { id(obj): ('builtin', name) for name, obj in __BUILTINS.items() }
+
+# A cached file only stores its own objects. Builtins, doc.h types and objects
+# of included files are stored by reference and taken back from the current
+# universe and from the included files, so types keep their identity. Doc.h
+# types are only looked up when reached, so saving a file does not load the
+# classes and namespaces it does not use.
+
+def __enum_references (universe):
+    references = dict()
+    if universe.namespaces.loaded:
+        for name, namespace in universe.namespaces.items():
+            for enum in namespace.filescope.elements.get(MSEnum, dict()).values():
+                references[id(enum)] = ('namespace_enum', name, enum.name)
+
+    if universe.classes.loaded:
+        for name, _class in universe.classes.items():
+            if _class.loaded >= MSClass.ENUMS:
+                for enum in _class.enums.values():
+                    references[id(enum)] = ('class_enum', name, enum.name)
+
+    return references
+
+def __references (universe, dependencies):
+    references = dict()
+    for filepath, prog in dependencies.items():
+        references[id(prog)] = ('prog', filepath)
+        references[id(prog.scope)] = ('scope', filepath)
+        references[id(prog.diagnostics)] = ('diagnostics', filepath)
+        for type, objects in prog.scope.elements.items():
+            for name, obj in objects.items():
+                references.setdefault(id(obj), ('element', filepath, type, name))
+
+    enums = None
+    def persistent_id (obj):
+        nonlocal enums
+        if id(obj) in __BUILTIN_IDS:
+            return __BUILTIN_IDS[id(obj)]
+        elif isinstance(obj, MSClass):
+            if universe.classes.loaded and universe.classes.get(obj.name) is obj: return ('class', obj.name)
+        elif isinstance(obj, MSInclude):
+            if universe.namespaces.loaded and universe.namespaces.get(obj.name) is obj: return ('namespace', obj.name)
+        elif isinstance(obj, MSEnum):
+            enums = enums if enums != None else __enum_references(universe)
+            if id(obj) in enums: return enums[id(obj)]
+        return references.get(id(obj), None)
+
+    return persistent_id
+
+def __persistent_load (universe, dependencies, pid):
+    kind, *args = pid
+    if   kind == 'builtin':
+        return __BUILTINS[args[0]]
+    elif kind == 'namespace':
+        return universe.namespaces[args[0]]
+    elif kind == 'namespace_enum':
+        return universe.namespaces[args[0]].filescope.elements[MSEnum][args[1]]
+    elif kind == 'class':
+        return universe.classes[args[0]]
+    elif kind == 'class_enum':
+        return universe.classes[args[0]].get_enum(args[1])
+    elif kind == 'prog':
+        return dependencies[args[0]]
+    elif kind == 'scope':
+        return dependencies[args[0]].scope
+    elif kind == 'diagnostics':
+        return dependencies[args[0]].diagnostics
+    else:
+        filepath, type, name = args
+        return dependencies[filepath].scope.elements[type][name]
+
+def __reduce_array (array):
+    return (get_array, (array.elemtype, array.keytype if array.associative != 0 else VOID))
+
+def __get_dependencies (included, dependencies=None):
+    dependencies = dependencies if dependencies != None else dict()
+    for filepath, dependency in included:
+        if filepath not in dependencies:
+            dependencies[filepath] = dependency
+            __get_dependencies(dependency.dependencies, dependencies)
+    return dependencies
+
+def __get_key (digest, universe_key, dependencies):
+    return sha1(repr((digest, universe_key, dependencies)).encode()).hexdigest()
+
+def get_cache_filename (cache_dir, full_filename):
+    return os.path.join(cache_dir, sha1(os.path.abspath(full_filename).encode()).hexdigest() + '.ast')
+
+def is_cache_enabled (parser):
+    return parser.cache_dir != None and not parser.lexer.keep_comments
+
+def load_prog (parser, full_filename, data):
+    if not is_cache_enabled(parser): return None
+
+    try:
+        with open(get_cache_filename(parser.cache_dir, full_filename), 'rb') as f:
+            format, digest, universe_key, dependency_keys = pickle.load(f)
+            if (format, digest, universe_key) != (__FORMAT, sha1(data.encode()).hexdigest(), parser.universe.get_key()):
+                return None
+
+            # Included files are loaded (or parsed) first, and must not have changed
+            dependencies = list()
+            for filepath, key in dependency_keys:
+                dependency = parser.pool.parse_file(filepath)
+                if getattr(dependency, 'key', None) != key: return None
+                dependencies.append((filepath, dependency))
+
+            unpickler = pickle.Unpickler(f)
+            unpickler.persistent_load = partial(__persistent_load, parser.universe,
+                                                __get_dependencies(dependencies))
+            prog = unpickler.load()
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, KeyError, AttributeError):
+        return None
+
+    prog.key = __get_key(digest, universe_key, dependency_keys)
+    return prog
+
+def save_prog (parser, full_filename, data, prog):
+    prog.key = None
+    if not is_cache_enabled(parser) or isinstance(prog, ASTProgError): return
+
+    dependency_keys = [ (filepath, getattr(dependency, 'key', None)) for filepath, dependency in prog.dependencies ]
+    if any( key == None for _, key in dependency_keys ): return
+
+    digest, universe_key = sha1(data.encode()).hexdigest(), parser.universe.get_key()
+    prog.key = __get_key(digest, universe_key, dependency_keys)
+
+    filename = get_cache_filename(parser.cache_dir, full_filename)
+    temporary = f'{filename}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        os.makedirs(parser.cache_dir, exist_ok=True)
+        with open(temporary, 'wb') as f:
+            pickle.dump((__FORMAT, digest, universe_key, dependency_keys), f)
+
+            pickler = pickle.Pickler(f, pickle.HIGHEST_PROTOCOL)
+            pickler.persistent_id = __references(parser.universe, __get_dependencies(prog.dependencies))
+            pickler.dispatch_table = { MSArray: __reduce_array }
+            pickler.dump(prog)
+        os.replace(temporary, filename)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError, RecursionError):
+        if os.path.exists(temporary): os.remove(temporary)
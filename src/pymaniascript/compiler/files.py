@@ -0,0 +1,142 @@
+from collections import OrderedDict
+from hashlib import sha1
+import os
+import threading
+
+class FileEntry:
+
+    __slots__ = ('prog', 'filename', 'stat', 'digest', 'size', 'dependencies')
+
+    def __init__ (self, prog, filename, stat, digest, size, dependencies):
+        self.prog, self.filename = prog, filename
+        self.stat, self.digest, self.size = stat, digest, size
+        self.dependencies = dependencies
+
+def get_file_stat (filename):
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+# Compiled files, keyed by (universe, filename). An entry is only returned if
+# its file is unchanged on disk (same mtime and size, or else same content) and
+# the files it includes are still the ones it was compiled with. Least recently
+# used entries are evicted once there are more than 'max_entries' files or
+# more than 'max_size' characters of source. Compilations running in other
+# threads can share the cache, each call holds its lock.
+class FileCache:
+
+    def __init__ (self, max_entries=None, max_size=None):
+        self.max_entries, self.max_size = max_entries, max_size
+        self.entries = OrderedDict()
+        self.lock = threading.RLock()
+        self.size = 0
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def __len__ (self):
+        return len(self.entries)
+
+    def __contains__ (self, key):
+        return key in self.entries
+
+    def get (self, key):
+        with self.lock:
+            if self.__validate(key, set()):
+                self.hits += 1
+                self.__touch(key, set())
+                return self.entries[key].prog
+
+            self.misses += 1
+            return None
+
+    def put (self, key, prog, stat=None, data=None, dependencies=()):
+        digest = sha1(data.encode()).hexdigest() if data != None else None
+        size = len(data) if data != None else 0
+
+        with self.lock:
+            self.__remove(key)
+            self.entries[key] = FileEntry(prog, key[1], stat, digest, size, list(dependencies))
+            self.size += size
+            self.__touch(key, set())
+            self.__evict()
+
+    def invalidate (self, filename):
+        filename = os.path.abspath(filename)
+        with self.lock:
+            keys = [ key for key, entry in self.entries.items() if os.path.abspath(entry.filename) == filename ]
+            for key in keys:
+                self.__remove(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear (self):
+        with self.lock:
+            self.invalidations += len(self.entries)
+            self.entries.clear()
+            self.size = 0
+
+    def stats (self):
+        with self.lock:
+            return { 'entries': len(self.entries), 'size': self.size,
+                     'hits': self.hits, 'misses': self.misses,
+                     'evictions': self.evictions, 'invalidations': self.invalidations }
+
+    def __remove (self, key):
+        entry = self.entries.pop(key, None)
+        if entry != None:
+            self.size -= entry.size
+
+    def __validate (self, key, checked):
+        entry = self.entries.get(key, None)
+        if entry == None: return False
+        if key in checked: return True
+        checked.add(key)
+
+        if not self.__is_unchanged(entry):
+            self.__remove(key)
+            self.invalidations += 1
+            return False
+
+        for dependency_key, dependency in entry.dependencies:
+            if not self.__validate(dependency_key, checked) or self.entries[dependency_key].prog is not dependency:
+                self.__remove(key)
+                self.invalidations += 1
+                return False
+
+        return True
+
+    def __is_unchanged (self, entry):
+        stat = get_file_stat(entry.filename)
+        if stat == None or entry.stat == None:
+            return stat == entry.stat
+        if stat == entry.stat:
+            return True
+        if stat[1] != entry.stat[1]:
+            return False
+
+        # Touched but maybe not modified, so the content decides
+        try:
+            with open(entry.filename, 'r') as f: data = f.read()
+        except OSError:
+            return False
+        if sha1(data.encode()).hexdigest() != entry.digest:
+            return False
+        entry.stat = stat
+        return True
+
+    # Included files are more recently used than their includers, so an
+    # includer is evicted before the files it would need again
+    def __touch (self, key, touched):
+        if key in touched or key not in self.entries: return
+        touched.add(key)
+        self.entries.move_to_end(key)
+        for dependency_key, _ in self.entries[key].dependencies:
+            self.__touch(dependency_key, touched)
+
+    def __evict (self):
+        while len(self.entries) != 0 and ((self.max_entries != None and len(self.entries) > self.max_entries) or
+                                          (self.max_size    != None and self.size         > self.max_size)):
+            key, entry = self.entries.popitem(last=False)
+            self.size -= entry.size
+            self.evictions += 1
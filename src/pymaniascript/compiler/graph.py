@@ -0,0 +1,142 @@
+from .tokens import TokenType
+from .lexer import Lexer
+from .files import get_file_stat
+from pymaniascript.msobjects import UNIVERSE
+import json
+import os
+import threading
+
+INCLUDE, EXTENDS, NAMESPACE = 'include', 'extends', 'namespace'
+
+__DIRECTIVES = { TokenType.LXR_DIRECTIVE_INCLUDE: INCLUDE, TokenType.LXR_DIRECTIVE_EXTENDS: EXTENDS }
+
+def get_directives (lexer, text):
+    # Nothing after the last directive needs to be lexed
+    last = max(text.rfind('#Include'), text.rfind('#Extends'))
+    if last == -1: return
+
+    directive = None
+    for token in lexer.iter_tokens(text):
+        if directive == None and token.start > last: return
+        if directive != None and token.type == TokenType.LXR_STRING:
+            yield directive, token.value.value
+        directive = __DIRECTIVES.get(token.type, None)
+
+# Who includes whom in a Scripts folder, found by only lexing the files. Files
+# are named as in '#Include' (relative to the folder, with '/'), and doc.h
+# namespaces are kept as 'namespace' edges so they can be asked for too.
+class DependencyGraph:
+
+    FORMAT = 1
+
+    def __init__ (self, folder, universe=None, suffix='.Script.txt'):
+        self.folder, self.suffix = folder, suffix
+        self.universe = universe if universe != None else UNIVERSE
+        self.lexer = Lexer(self.universe)
+        self.files, self.edges, self.reverse = dict(), dict(), dict()
+
+    def get_filename (self, filepath):
+        return self.folder + os.sep + filepath
+
+    def scan_file (self, filepath):
+        self.__remove_edges(filepath)
+        stat = get_file_stat(self.get_filename(filepath))
+        try:
+            with open(self.get_filename(filepath), 'r') as f: data = f.read()
+        except OSError:
+            self.files.pop(filepath, None)
+            return
+
+        edges = dict()
+        for kind, target in get_directives(self.lexer, data):
+            if kind == INCLUDE and target in self.universe.namespaces:
+                kind = NAMESPACE
+            edges.setdefault(target, kind)
+
+        self.files[filepath] = stat
+        self.__add_edges(filepath, edges)
+
+    def refresh (self, filepaths=None):
+        if filepaths == None:
+            filepaths = set()
+            for head, _, tails in os.walk(self.folder):
+                for tail in tails:
+                    if tail.endswith(self.suffix):
+                        filepaths.add(os.path.relpath(os.path.join(head, tail), self.folder).replace(os.sep, '/'))
+
+        # Included files are followed even if they do not have the suffix
+        changed, seen, stack = set(), set(), [ *filepaths, *self.files ]
+        while len(stack) != 0:
+            filepath = stack.pop()
+            if filepath in seen: continue
+            seen.add(filepath)
+
+            stat = get_file_stat(self.get_filename(filepath))
+            if stat != self.files.get(filepath, None):
+                self.scan_file(filepath)
+                changed.add(filepath)
+            stack.extend( target for target, kind in self.edges.get(filepath, dict()).items() if kind != NAMESPACE )
+
+        return changed
+
+    def dependencies (self, filepath, transitive=False):
+        return self.__walk([filepath], lambda node: self.edges.get(node, dict()), transitive)
+
+    def dependents (self, filepath, transitive=False):
+        return self.__walk([filepath], lambda node: self.reverse.get(node, set()), transitive)
+
+    def affected (self, filepaths):
+        return { filepath for filepath in self.__walk(filepaths, lambda node: self.reverse.get(node, set()), True, True)
+                 if filepath in self.files }
+
+    def roots (self):
+        return { filepath for filepath in self.files if len(self.reverse.get(filepath, set())) == 0 }
+
+    def save (self, filename):
+        data = { 'format': self.FORMAT, 'doch': self.universe.get_key(), 'suffix': self.suffix,
+                 'files': { filepath: list(stat) for filepath, stat in self.files.items() },
+                 'edges': { filepath: [ [target, kind] for target, kind in edges.items() ] for filepath, edges in self.edges.items() } }
+        temporary = f'{filename}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temporary, 'w') as f:
+            json.dump(data, f, indent=1)
+        os.replace(temporary, filename)
+
+    @classmethod
+    def load (cls, filename, folder, universe=None):
+        graph = cls(folder, universe)
+        try:
+            with open(filename, 'r') as f: data = json.load(f)
+        except (OSError, ValueError):
+            return graph
+
+        # Namespaces depend on the doc.h, so edges found with another one are dropped
+        if data.get('format', None) != cls.FORMAT or data.get('doch', None) != graph.universe.get_key():
+            return graph
+
+        graph.suffix = data['suffix']
+        for filepath, stat in data['files'].items():
+            graph.files[filepath] = tuple(stat)
+        for filepath, edges in data['edges'].items():
+            graph.__add_edges(filepath, dict(edges))
+        return graph
+
+    def __add_edges (self, filepath, edges):
+        self.edges[filepath] = edges
+        for target in edges:
+            self.reverse.setdefault(target, set()).add(filepath)
+
+    def __remove_edges (self, filepath):
+        for target in self.edges.pop(filepath, dict()):
+            dependents = self.reverse[target]
+            dependents.discard(filepath)
+            if len(dependents) == 0: del self.reverse[target]
+
+    def __walk (self, nodes, neighbours, transitive, inclusive=False):
+        result = set(nodes) if inclusive else set()
+        stack = list(nodes)
+        while len(stack) != 0:
+            for neighbour in neighbours(stack.pop()):
+                if neighbour not in result:
+                    result.add(neighbour)
+                    if transitive: stack.append(neighbour)
+        return result
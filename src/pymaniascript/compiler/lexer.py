@@ -1,7 +1,8 @@
 from sly.lex import Lexer as SlyLexer, LexerMeta as LM
 from .tokens import TokenType
-from pymaniascript.ast import Index, ASTTerminalValue, ASTTerminal
+from pymaniascript.ast import Lines, ASTTerminalValue, ASTTerminal
 from pymaniascript.msobjects import *
+import re
 
 __wrapper = LM.__prepare__(None, None)['_']
 def __ (token_type, *regexes):
@@ -64,8 +65,6 @@ KEYWORDS_ELEMS = {
         (NULL, TokenType.LXR_NULL),
         (NULLID, TokenType.LXR_NULLID),
 
-        *[ (c, TokenType.LXR_TYPE_CLASS) for c in CLASSES.values() ],
-
         (VOID, TokenType.LXR_TYPE_VOID),
         (INTEGER, TokenType.LXR_TYPE_INTEGER),
         (REAL, TokenType.LXR_TYPE_REAL),
@@ -79,46 +78,169 @@ KEYWORDS_ELEMS = {
     ]
 }
 
+class Patterns:
+    
+    # Comment and string bodies are scanned by their token functions instead of
+    # the master regex. Bodies are unrolled loops (every character can only be
+    # consumed by one branch) and a scan that finds no terminator is remembered
+    # (see Lexer.__scan), so no character is scanned twice.
+    LINE_COMMENT = r'//[^\n]*'
+    STRING_BODY  = re.compile(r'[^\"\\\n]*(?:\\[\s\S][^\"\\\n]*)*')
+    TRIPLE_BODY  = re.compile(r'[^\"{]*(?:(?:\"(?!\"\")|{(?!{{))[^\"{]*)*')
+
 class Limit:
     
-    def __init__(self, start, end):
-        self.start, self.end = start, end
+    __slots__ = ('start', 'end', 'lines')
+    
+    def __init__(self, start, end, lines):
+        self.start, self.end, self.lines = start, end, lines
+
+class Token:
+    
+    __slots__ = ('type', 'start', 'end', 'value')
+    
+    def __init__(self, type, start, end, value=None):
+        self.type, self.start, self.end, self.value = type, start, end, value
+
+TRIPLE_TOKENS = { TokenType.LXR_STRING_AND_CONCAT,
+                  TokenType.LXR_CONCAT_AND_STRING,
+                  TokenType.LXR_CONCAT_AND_STRING_AND_CONCAT }
+
+# Tokens produced when '/*', '}}}', '"' or '"""' is not terminated
+UNTERMINATED_TOKENS = { TokenType.LXR_OPERATOR_DIV,
+                        TokenType.LXR_BRACKET_CURLY_CL,
+                        TokenType.LXR_UNKNOWN }
+
+# Farthest a token can be read past its end by the alternatives of the master
+# regex that failed on it (the longest being '#RequireContext')
+LOOKAHEAD = 16
 
 class Lexer (SlyLexer):
 
     tokens = [t.name for t in TokenType if t.is_lexer() and not t.is_lexer_ignored()]
     
-    def __get_index (self, index):
-        return Index(index, self.text)
+    def __init__ (self, universe=None, comments=False):
+        self.universe = universe if universe != None else UNIVERSE
+        self.keep_comments = comments
+    
+    def __token (self, t, value=None):
+        return Token(TokenType[t.type], t.index, self.index, value)
     
-    def __get_limit (self, t):
-        return Limit(self.__get_index(t.index), self.__get_index(self.index))
+    def __tokenize (self, text, index=0):
+        self.local_structs, self.local_includes = dict(), dict()
+        self.lines = Lines(text)
+        self.comments = list() if self.keep_comments else None
+        self.failed_scans = dict()
+        return super().tokenize(text, index=index)
+    
+    def iter_tokens (self, text, index=0):
+        for tok in self.__tokenize(text, index):
+            yield tok.value
     
     def tokenize (self, text):
-        self.local_structs, self.local_includes, self.token_stack = dict(), dict(), list()
-        tokenizer = super().tokenize(text)
-        
-        def _tokenizer ():           
-            for tok in tokenizer:
-                self.token_stack.append(tok.value)
-                yield tok
-        return _tokenizer()
+        for tok in self.__tokenize(text):
+            tok.value = self.get_terminal(tok.value)
+            yield tok
+    
+    def get_terminal (self, token):
+        limit = Limit(token.start, token.end, self.lines)
+        if   token.value != None:
+            return ASTTerminalValue(limit, token.value)
+        elif token.type in TRIPLE_TOKENS:
+            return ASTTerminal(limit, self.text[token.start+3:token.end-3])
+        else:
+            return ASTTerminal(limit, self.text[token.start:token.end])
+    
+    def relex (self, text, tokens, offset, removed, inserted):
+        new_text = text[:offset] + inserted + text[offset+removed:]
+        delta, edit_end = len(inserted) - removed, offset + len(inserted)
+
+        # Tokens which have not read the edited text are kept, and lexing
+        # resumes where the last of them ended.
+        kept = min(Lexer.__bisect(tokens, offset - LOOKAHEAD, lambda token: token.end),
+                   Lexer.__unterminated(text, tokens, offset))
+        result, old = tokens[:kept], kept
+
+        for token in self.iter_tokens(new_text, tokens[kept-1].end if kept > 0 else 0):
+            result.append(token)
+            if token.end < edit_end: continue
+
+            # Once both streams end at the same place after the edit, the rest
+            # of the old stream is what lexing the same text would give. Its
+            # tokens are moved by the edit, in place.
+            while old < len(tokens) and tokens[old].end + delta < token.end: old += 1
+            if old < len(tokens) and tokens[old].end + delta == token.end:
+                rest = tokens[old+1:]
+                if delta != 0:
+                    for t in rest: t.start += delta; t.end += delta
+                result.extend(rest)
+                break
+
+        return new_text, result
+
+    @staticmethod
+    def __bisect (tokens, position, key):
+        low, high = 0, len(tokens)
+        while low < high:
+            middle = (low + high) // 2
+            if key(tokens[middle]) <= position: low = middle + 1
+            else: high = middle
+        return low
+
+    @staticmethod
+    def __unterminated (text, tokens, offset):
+        # Unterminated literals are read until the end of the text, so they come
+        # after the last terminator. '"' is read until an unescaped newline.
+        candidates = list()
+        def find (opener, start):
+            start = text.find(opener, max(start, 0), offset)
+            while start != -1:
+                candidates.append(start)
+                start = text.find(opener, start + 1, offset)
+
+        last_triple = max(text.rfind('\"\"\"'), text.rfind('{{{'))
+        find('/*', text.rfind('*/') - 1)
+        find('}}}', last_triple - 2)
+        find('\"\"\"', last_triple - 2)
+
+        line = text.rfind('\n', 0, offset)
+        while line > 0 and text[line-1] == '\\': line = text.rfind('\n', 0, line)
+        find('\"', line)
+
+        for start in sorted(candidates):
+            index = Lexer.__bisect(tokens, start - 1, lambda token: token.start)
+            if index < len(tokens) and tokens[index].start == start and tokens[index].type in UNTERMINATED_TOKENS:
+                return index
+        return len(tokens)
     
     @__(TokenType.LXR_UNKNOWN)
     def error (self, t):
-        limit = Limit(self.__get_index(self.index), self.__get_index(self.index+1))
-        t.value = ASTTerminalValue(limit, f'Unexpected character \'{t.value[0]}\'.')
+        t.value = Token(TokenType.LXR_UNKNOWN, self.index, self.index+1, f'Unexpected character \'{t.value[0]}\'.')
         self.index += 1
         return t
 
     # ---
 
     def __basic (self, t):
-        t.value = ASTTerminal(self.__get_limit(t), t.value)
+        t.value = self.__token(t)
         return t
     
-    def __triple (self, t):
-        t.value = t.value[3:-3]
+    def __scan (self, kind, start, pattern, terminators):
+        # A scan which went through 'start' without finding a terminator would
+        # read the exact same characters again, so it fails right away.
+        failed = self.failed_scans.get(kind, None)
+        if failed != None and failed[0] <= start <= failed[1]: return None
+
+        end = pattern.match(self.text, start).end()
+        if not self.text.startswith(terminators, end):
+            self.failed_scans[kind] = (start, end)
+            return None
+        return end
+    
+    def __fallback (self, t, token_type):
+        # An unterminated literal only consumes its first character
+        self.index = t.index + 1
+        t.type = token_type.name
         return self.__basic(t)
 
     # ---
@@ -126,56 +248,92 @@ class Lexer (SlyLexer):
     @__(TokenType.LXR_WHITESPACE, r'\s+')
     def whitespace (self, t): pass
     
-    comments = __(TokenType.LXR_COMMENT, r'(//.*)|(/\*(.|\n)*?\*/)')(__basic)
+    @__(TokenType.LXR_COMMENT, Patterns.LINE_COMMENT, r'/\*')
+    def comment (self, t):
+        if t.value == '/*':
+            failed = self.failed_scans.get('comment', None)
+            end = self.text.find('*/', t.index + 2) if failed == None else -1
+            if end == -1:
+                self.failed_scans['comment'] = (t.index, len(self.text))
+                return self.__fallback(t, TokenType.LXR_OPERATOR_DIV)
+            self.index = end + 2
+
+        if self.comments != None:
+            self.comments.append(Limit(t.index, self.index, self.lines))
 
     # ---
 
     @__(TokenType.LXR_FLOAT, r'[0-9]+[eE][+-]?[0-9]+', r'[0-9]+\.(?![0-9])([eE][+-]?[0-9]+)?', r'[0-9]*\.[0-9]+([eE][+-]?[0-9]+)?')
     def decimal (self, t):
-        t.value = ASTTerminalValue(self.__get_limit(t), MSValue('@LITERAL', REAL, True, float(t.value)))
+        t.value = self.__token(t, MSValue('@LITERAL', REAL, True, float(t.value)))
         return t
 
     @__(TokenType.LXR_NATURAL, r'[0-9]+(?![0-9]*\.)')
     def integer (self, t):
-        t.value = ASTTerminalValue(self.__get_limit(t), MSValue('@LITERAL', INTEGER, True, int(t.value)))
+        t.value = self.__token(t, MSValue('@LITERAL', INTEGER, True, int(t.value)))
         return t
     
     @__(TokenType.LXR_IDENT, r'[a-zA-Z_][a-zA-Z0-9_]*')
     def ident (self, t):
         if   t.value in KEYWORDS_CONTROL:
             t.type = KEYWORDS_CONTROL[t.value].name
-            t.value = ASTTerminal(self.__get_limit(t), t.value)
+            t.value = self.__token(t)
         elif t.value in KEYWORDS_ELEMS:
             elem = KEYWORDS_ELEMS[t.value]
             t.type = elem[1].name
-            t.value = ASTTerminalValue(self.__get_limit(t), elem[0])
+            t.value = self.__token(t, elem[0])
+        elif t.value in self.universe.get_class_names():
+            t.type = TokenType.LXR_TYPE_CLASS.name
+            t.value = self.__token(t, self.universe.classes[t.value])
         elif t.value in self.local_structs:
             t.type = TokenType.LXR_LOCAL_STRUCT.name 
-            t.value = ASTTerminalValue(self.__get_limit(t), self.local_structs[t.value])
+            t.value = self.__token(t, self.local_structs[t.value])
         elif t.value in self.local_includes:
             t.type = TokenType.LXR_LOCAL_INCLUDE.name 
-            t.value = ASTTerminalValue(self.__get_limit(t), self.local_includes[t.value])
+            t.value = self.__token(t, self.local_includes[t.value])
         else:
             t.type = TokenType.LXR_IDENT.name
-            t.value = ASTTerminal(self.__get_limit(t), t.value)
+            t.value = self.__token(t)
         
         return t
 
     # ---
 
-    @__(TokenType.LXR_STRING, r'\"(?!\"\")([^\\\n]|(\\.)|(\\\n))*?\"', r'\"\"\"([^{]|{(?!{{))*?\"\"\"')
-    def string (self, t):           
-        if   t.value.startswith('\"\"\"'):
-            t.value = t.value[3:-3]
-        elif t.value.startswith('\"'):
-            t.value = t.value[1:-1]
+    @__(TokenType.LXR_STRING, r'\"')
+    def string (self, t):
+        if self.text.startswith('\"\"\"', t.index):
+            end = self.__scan('triple', t.index + 3, Patterns.TRIPLE_BODY, ('\"\"\"', '{{{'))
+            if end == None:
+                self.index = t.index
+                return self.error(t)
+
+            self.index = end + 3
+            if self.text.startswith('{{{', end):
+                t.type = TokenType.LXR_STRING_AND_CONCAT.name
+                return self.__basic(t)
+            t.value = self.text[t.index+3:end]
+        else:
+            end = self.__scan('string', t.index + 1, Patterns.STRING_BODY, '\"')
+            if end == None:
+                self.index = t.index
+                return self.error(t)
+
+            self.index = end + 1
+            t.value = self.text[t.index+1:end]
 
-        t.value = ASTTerminalValue(self.__get_limit(t), MSValue('@LITERAL', TEXT, True, t.value))
+        t.value = self.__token(t, MSValue('@LITERAL', TEXT, True, t.value))
         return t
 
-    string_and_concat            = __(TokenType.LXR_STRING_AND_CONCAT           , r'\"\"\"([^\"]|\"(?!\"\"))*?{{{')(__triple)
-    concat_and_string            = __(TokenType.LXR_CONCAT_AND_STRING           , r'}}}([^{]|{(?!{{))*?\"\"\"'    )(__triple)
-    concat_and_string_and_concat = __(TokenType.LXR_CONCAT_AND_STRING_AND_CONCAT, r'}}}([^\"]|\"(?!\"\"))*?{{{'   )(__triple)
+    @__(TokenType.LXR_CONCAT_AND_STRING, r'}}}')
+    def concat_and_string (self, t):
+        end = self.__scan('triple', t.index + 3, Patterns.TRIPLE_BODY, ('\"\"\"', '{{{'))
+        if end == None:
+            return self.__fallback(t, TokenType.LXR_BRACKET_CURLY_CL)
+
+        if self.text.startswith('{{{', end):
+            t.type = TokenType.LXR_CONCAT_AND_STRING_AND_CONCAT.name
+        self.index = end + 3
+        return self.__basic(t)
 
     # ---
 
@@ -1,12 +1,15 @@
 from .tokens import TokenType
 from .lexer import Lexer
+from .tables import compute_tables
+from .cache import CACHE_DIR, load_prog, save_prog
+from .files import FileCache, get_file_stat
 from sly.yacc import Parser as SlyParser, ParserMeta as PM, SlyLogger
 from pymaniascript.scope import Scope
 from pymaniascript.ast import *
 from pymaniascript.msobjects import *
 import os
 
-COMPUTED_FILES = dict()
+COMPUTED_FILES = FileCache()
 
 __wrapper = PM.__prepare__(None, None)['_']
 def __ (token_type, *ruleset):
@@ -71,11 +74,22 @@ class Parser (SlyParser):
     )
     
     start = TokenType.PRS_PROG.name
-    
-    def __init__ (self, folder):
+
+    # Replaces sly's table builder (a private method of sly's own 'Parser')
+    @classmethod
+    def _Parser__build_lrtables (cls):
+        cls._lrtable = compute_tables(cls._grammar)
+        return True
+
+    def __init__ (self, folder, universe=None, comments=False, pool=None, cache_dir=None, files=None, sources=None):
         super().__init__()
-        self.lexer = Lexer()
+        self.universe = universe if universe != None else UNIVERSE
+        self.lexer = Lexer(self.universe, comments)
         self.folder = folder
+        self.cache_dir = cache_dir if cache_dir != None else CACHE_DIR
+        self.files = files if files != None else COMPUTED_FILES
+        self.sources = sources if sources != None else dict()
+        self.pool = pool if pool != None else ParserPool(folder, self.universe, self.cache_dir, self.files, self.sources)
     
     def __empty (self):
         last = self.symstack[-1]
@@ -88,37 +102,68 @@ class Parser (SlyParser):
             if isinstance(last, list):
                 last = last[-1]
             
-            return ASTTerminalEmpty(last.end)
+            return ASTTerminalEmpty(last.end, last.lines)
     
     def parse_file (self, filepath):
+        self.pool.depth += 1
+        try:
+            return self.__parse_file(filepath)
+        finally:
+            self.pool.depth -= 1
+            if self.pool.depth == 0: self.pool.progs.clear()
+    
+    def __parse_file (self, filepath):
         full_filename = self.folder + os.sep + filepath
         self.reporter = reporter(filepath)
         
-        prog = COMPUTED_FILES.get(full_filename, None)
-        
-        if isinstance(prog, ASTTerminalEmpty):
-            prog = ASTProgError(f'Circular import found with script \'{full_filename}\'.', self.reporter)
-            COMPUTED_FILES[full_filename] = prog
+        key = (self.universe, full_filename)
+        if key in self.pool.progs:
+            prog = self.pool.progs[key]
+            if prog == None:
+                prog = ASTProgError(f'Circular import found with script \'{full_filename}\'.', self.reporter)
+                self.pool.progs[key] = prog
             return prog
-        elif isinstance(prog, ASTProg):
+        
+        prog = self.files.get(key)
+        if prog != None:
+            self.pool.progs[key] = prog
             return prog
         
         try:
-            with open(full_filename, 'r') as f: data = f.read()
+            stat, data = self.read_file(full_filename)
         except FileNotFoundError:
             prog = ASTProgError(f'File \'{full_filename}\' was not found.', self.reporter)
-            COMPUTED_FILES[full_filename] = prog
+            self.pool.progs[key] = prog
+            self.files.put(key, prog)
             return prog
         
-        COMPUTED_FILES[full_filename] = ASTTerminalEmpty.EMPTY
-        prog = self.parse(data)
-        COMPUTED_FILES[full_filename] = prog
+        self.pool.progs[key] = None
+        prog = load_prog(self, full_filename, data)
+        if prog == None:
+            prog = self.parse(data)
+            prog.dependencies = self.dependencies
+            save_prog(self, full_filename, data, prog)
+        self.pool.progs[key] = prog
+        self.files.put(key, prog, stat, data, [ ((self.universe, self.folder + os.sep + filepath), dependency)
+                                                for filepath, dependency in prog.dependencies ])
         return prog
     
+    # Sources can be read beforehand, as (stat, data), by callers that do not
+    # want parsing to block on reading included files
+    def read_file (self, full_filename):
+        source = self.sources.get(full_filename, None)
+        if source != None:
+            return source
+        
+        stat = get_file_stat(full_filename)
+        with open(full_filename, 'r') as f: return stat, f.read()
+    
     def parse (self, text):
         tokenizer = self.lexer.tokenize(text)
         self.filescope = Scope()
         self.errored_prog = None
+        self.dependencies = list()
+        self._line_positions, self._index_positions = dict(), dict()
         
         self.currentscope = self.filescope.subscope()
         
@@ -129,10 +174,6 @@ class Parser (SlyParser):
             return prog
     
     def error (self, t):
-        if t != None and TokenType[t.type].is_parser_ignored():
-            self.errok()
-            return next(self.tokens, None)
-        
         expected = list(self._lrtable.lr_action[self.state].keys())
         if '$end' in expected:
             expected.remove('$end')
@@ -210,9 +251,9 @@ class Parser (SlyParser):
         value = self.currentscope.get_element(vname, MSValue)
         if value == None:
             ret = ASTTerminalValue(p[0], MSValue(vname, VOID))
-            ret.reports.append(self.reporter(
+            self.reporter(
                 ERROR, ret, f'Variable \'{vname}\' does not exist in this scope.'
-            ))
+            )
             return ret
         else:
             return ASTTerminalValue(p[0], value)
@@ -231,9 +272,9 @@ class Parser (SlyParser):
         args = p[2] if isinstance(p[2], list) else []
         if fobj == None:
             func = ASTTerminalValue(p[0], MSFunction(vname, []))
-            func.reports.append(self.reporter(
-                ERROR, func, f'Function \'{vname}\' does not exist in this scope.'
-            ))
+            self.reporter(
+                ERROR, func, f'Function \'{vname}\' does not exist in this scope.', p[1].end
+            )
         else:
             func = ASTTerminalValue(p[0], fobj)
         
@@ -249,9 +290,9 @@ class Parser (SlyParser):
         args = p[3] if isinstance(p[3], list) else []
         if fobj == None:
             func = ASTTerminalValue(p[1], MSFunction(fname, []))
-            func.reports.append(self.reporter(
-                ERROR, func, f'Function \'{fname}\' does not exist in namespace \'{namespace.name}\'.'
-            ))
+            self.reporter(
+                ERROR, func, f'Function \'{fname}\' does not exist in namespace \'{namespace.name}\'.', p[2].end
+            )
         else:
             func = ASTTerminalValue(p[1], fobj)
         
@@ -275,9 +316,9 @@ class Parser (SlyParser):
             child = parent.get_attribute(cname)
             if child == None:
                 child = ASTTerminalValue(p[2], MSValue(cname, VOID))
-                child.reports.append(self.reporter(
+                self.reporter(
                     ERROR, child, f'\'{parent.name}\' has no attribute \'{cname}\'.'
-                ))
+                )
             else:
                 child = ASTTerminalValue(p[2], child)
                 
@@ -288,9 +329,9 @@ class Parser (SlyParser):
             child = parent.get_method(cname)
             if child == None:
                 child = ASTTerminalValue(p[2], MSFunction(cname, []))
-                child.reports.append(self.reporter(
-                    ERROR, child, f'\'{parent.name}\' has no method \'{cname}\'.'
-                ))
+                self.reporter(
+                    ERROR, child, f'\'{parent.name}\' has no method \'{cname}\'.', p[3].end
+                )
             else:
                 child = ASTTerminalValue(p[2], child)
                 
@@ -307,7 +348,7 @@ class Parser (SlyParser):
             cls = p[2].value
             value = MSValue(f'@{cls.name}', cls, True)
             args = [ASTTerminalValue(p[2], value), p[0]]
-            func_limits = ASTTerminalEmpty.Empty(p[0].start)
+            func_limits = ASTTerminalEmpty.Empty(p[0].start, p[0].lines)
             func = ASTTerminalValue(func_limits, CAST)
         else:
             cls = p[2].value
@@ -329,9 +370,9 @@ class Parser (SlyParser):
             struct = namespace.get_element(sname, MSStruct)
             if struct == None:
                 struct = ASTTerminalValue(p[1], MSStruct(sname, {}))
-                struct.reports.append(self.reporter(
-                    ERROR, struct, f'Struct \'{sname}\' does not exist in namespace \'{namespace.name}\'.'
-                )) 
+                self.reporter(
+                    ERROR, struct, f'Struct \'{sname}\' does not exist in namespace \'{namespace.name}\'.', p[2].end
+                ) 
             else:
                 struct = ASTTerminalValue(p[1], struct)
             
@@ -369,9 +410,9 @@ class Parser (SlyParser):
         obj = namespace.get_element(vname, MSValue)
         if obj == None:
             obj = ASTTerminalValue(p[1], MSValue(vname, VOID))
-            obj.reports.append(self.reporter(
+            self.reporter(
                 ERROR, obj, f'Attribute \'{vname}\' does not exist in namespace \'{namespace.name}\'.'
-            ))
+            )
         else:
             obj = ASTTerminalValue(p[1], obj)
         
@@ -427,9 +468,9 @@ class Parser (SlyParser):
         
         if enum == None:
             enum = ASTTerminalValue(p[1], MSEnum(ename, []))
-            enum.reports.append(self.reporter(
+            self.reporter(
                 ERROR, enum, f'Enum \'{ename}\' does not exists in namespace \'{namespace.name}\'.'
-            ))
+            )
         else:
             enum = ASTTerminalValue(p[1], enum)
         
@@ -438,9 +479,9 @@ class Parser (SlyParser):
         enum_value = enum.value.get_value(evname)
         if enum_value == None:
             enum_value = ASTTerminalValue(p[3], MSValue(evname, enum, True))
-            enum_value.reports.append(self.reporter(
+            self.reporter(
                 ERROR, enum_value, f'Enum \'{enum.value.name}\' has no value \'{evname}\'.'
-            ))
+            )
         else:
             enum_value = ASTTerminalValue(p[3], enum_value)
         return ASTEnum(p, enum, enum_value)
@@ -491,9 +532,9 @@ class Parser (SlyParser):
             [TokenType.PRS_EXPRESSION, TokenType.LXR_SEMICOLON])
     def statement_expression (self, p):
         if p[0].type != VOID:
-            p[0].reports.append(self.reporter(
+            self.reporter(
                 WARNING, p[0], f'\'{p[0].value.name}\' will be discarded.'
-            ))
+            )
 
         return p[0]
 
@@ -537,9 +578,9 @@ class Parser (SlyParser):
         v = ASTDeclare(p, p[1], p[2], p[3], p[4], p[5], p[6][0], p[6][1], self.reporter)
         
         if self.currentscope.get_element(v.name, MSValue, True) != None:
-            v.reports.append(self.reporter(
+            self.reporter(
                 ERROR, v, f'\'{v.name}\' was already declared in this block.'
-            ))
+            )
         else:
             self.currentscope.add_element(v.value)
         
@@ -588,7 +629,7 @@ class Parser (SlyParser):
             [TokenType.LXR_KEYWORD_FOR, TokenType.LXR_BRACKET_ROUND_OP, TokenType.PRS_EMPTY_NEW_SCOPE, TokenType.PRS_FOR_NEW_VALUE, TokenType.LXR_COMMA, TokenType.PRS_EXPRESSION, TokenType.LXR_COMMA, TokenType.PRS_EXPRESSION, TokenType.LXR_BRACKET_ROUND_CL, TokenType.PRS_STATEMENT, TokenType.PRS_EMPTY_OLD_SCOPE],
             [TokenType.LXR_KEYWORD_FOR, TokenType.LXR_BRACKET_ROUND_OP, TokenType.PRS_EMPTY_NEW_SCOPE, TokenType.PRS_FOR_NEW_VALUE, TokenType.LXR_COMMA, TokenType.PRS_EXPRESSION, TokenType.LXR_COMMA, TokenType.PRS_EXPRESSION, TokenType.LXR_COMMA, TokenType.PRS_EXPRESSION, TokenType.LXR_BRACKET_ROUND_CL, TokenType.PRS_STATEMENT, TokenType.PRS_EMPTY_OLD_SCOPE])
     def _for (self, p):
-        step = ASTTerminalEmpty(p[7].end) if len(p) == 11 else p[9]
+        step = ASTTerminalEmpty(p[7].end, p[7].lines) if len(p) == 11 else p[9]
         return ASTFor(p, p[3], p[5], p[7], step, p[-2], self.reporter)
         
     
@@ -619,9 +660,9 @@ class Parser (SlyParser):
             if not isinstance(array.type, MSArray):
                 value = MSValue(p[0].content, VOID, True)
                 iterator = ASTTerminalValue(p[0], value)
-                array.reports.append(self.reporter(
+                self.reporter(
                     ERROR, array, f'\'{array.value.name}\' is not an array.'
-                ))
+                )
             else:
                 value = MSValue(p[0].content, array.type.elemtype, True)
                 iterator = ASTTerminalValue(p[0], value)
@@ -634,9 +675,9 @@ class Parser (SlyParser):
                 elem = MSValue(p[2].content, VOID, True)
                 key = ASTTerminalValue(p[0], key)
                 elem = ASTTerminalValue(p[0], elem)
-                array.reports.append(self.reporter(
+                self.reporter(
                     ERROR, array, f'\'{array.value.name}\' is not an array.'
-                ))
+                )
             else:
                 key = MSValue(p[0].content, array.type.keytype, True)
                 elem = MSValue(p[2].content, array.type.elemtype, True)
@@ -654,9 +695,9 @@ class Parser (SlyParser):
             [TokenType.LXR_KEYWORD_IF, TokenType.LXR_BRACKET_ROUND_OP, TokenType.PRS_EXPRESSION, TokenType.LXR_BRACKET_ROUND_CL, TokenType.PRS_EMPTY_NEW_SCOPE, TokenType.PRS_STATEMENT, TokenType.PRS_EMPTY_OLD_SCOPE, TokenType.LXR_KEYWORD_ELSE, TokenType.PRS_EMPTY_NEW_SCOPE, TokenType.PRS_STATEMENT, TokenType.PRS_EMPTY_OLD_SCOPE])
     def if_else (self, p):
         if len(p) == 7:
-            elseblock = ASTTerminalEmpty(p[5].end)
+            elseblock = ASTTerminalEmpty(p[5].end, p[5].lines)
         else:
-            elseblock = p[7]
+            elseblock = p[9]
         return ASTIfElse(p, p[2], p[5], elseblock, self.reporter)
     
     @__(TokenType.PRS_STATEMENT,
@@ -706,7 +747,7 @@ class Parser (SlyParser):
             [TokenType.LXR_KEYWORD_DEFAULT, TokenType.LXR_COLON, TokenType.PRS_EMPTY_NEW_SCOPE, TokenType.PRS_STATEMENT, TokenType.PRS_EMPTY_OLD_SCOPE],
             [TokenType.PRS_EMPTY])
     def default (self, p):
-        if len(p) == 3:
+        if len(p) == 5:
             return ASTDefault(p, p[3])
         else:
             return p[0]
@@ -829,9 +870,9 @@ class Parser (SlyParser):
         
         if type == None:
             type = ASTTerminalValue(p[1], VOID)
-            type.reports.append(self.reporter(
+            self.reporter(
                 ERROR, type, f'Struct or enum \'{tname}\' does not exist in namespace {namespace.name}.'
-            ))
+            )
         else:
             type = ASTTerminalValue(p[1], type)
         
@@ -900,9 +941,9 @@ class Parser (SlyParser):
         v = ASTDeclare(p, p[1], p[2], p[3], p[4], p[5], p[6][0], p[6][1], self.reporter, True)
         
         if self.currentscope.get_element(v.name, MSValue, True) != None:
-            v.reports.append(self.reporter(
+            self.reporter(
                 ERROR, v, f'\'{v.name}\' was already declared in this block.'
-            ))
+            )
         else:
             self.currentscope.add_element(v.value)
         
@@ -911,7 +952,7 @@ class Parser (SlyParser):
     @__(TokenType.PRS_GLOBAL_DEFINITION,
             [TokenType.LXR_TRIPLE_ASTERISK, TokenType.LXR_IDENT, TokenType.LXR_TRIPLE_ASTERISK, TokenType.PRS_EMPTY_NEW_SCOPE, TokenType.LXR_TRIPLE_ASTERISK, TokenType.PRS_STATEMENT_LIST, TokenType.PRS_EMPTY_OLD_SCOPE, TokenType.LXR_TRIPLE_ASTERISK])
     def label_def (self, p):
-        label = ASTLabelDef(p, p[1], ASTBlock(p[5], p[5]))
+        label = ASTLabelDef(p, p[1], ASTBlock(p[5], p[5]), self.reporter)
         self.filescope.add_element(label.value)
         return label
     
@@ -984,9 +1025,9 @@ class Parser (SlyParser):
         
         if enum == None:
             enum = ASTTerminalValue(p[1], MSEnum(ename, []))
-            enum.reports.append(self.reporter(
+            self.reporter(
                 ERROR, enum, f'Enum \'{ename}\' does not exist in namespace {namespace.name}.'
-            ))
+            )
         else:
             enum = ASTTerminalValue(p[1], enum)
         
@@ -995,9 +1036,9 @@ class Parser (SlyParser):
         enum_value = enum.value.get_value(evname)
         if enum_value == None:
             enum_value = ASTTerminalValue(p[3], MSValue(evname, enum, True))
-            enum_value.reports.append(self.reporter(
+            self.reporter(
                 ERROR, enum_value, f'Enum \'{enum.value.name}\' has no value \'{evname}\'.'
-            ))
+            )
         else:
             enum_value = ASTTerminalValue(p[3], enum_value)
         return ASTEnum(p, enum, enum_value)
@@ -1028,9 +1069,9 @@ class Parser (SlyParser):
             struct = namespace.get_element(sname, MSStruct)
             if struct == None:
                 struct = ASTTerminalValue(p[1], MSStruct(sname, {}))
-                struct.reports.append(self.reporter(
-                    ERROR, struct, f'Struct \'{sname}\' does not exist in namespace \'{namespace.name}\'.'
-                )) 
+                self.reporter(
+                    ERROR, struct, f'Struct \'{sname}\' does not exist in namespace \'{namespace.name}\'.', p[2].end
+                ) 
             else:
                 struct = ASTTerminalValue(p[1], struct)
             
@@ -1066,9 +1107,9 @@ class Parser (SlyParser):
             obj = namespace.get_element(vname, MSValue)
             if obj == None:
                 obj = ASTTerminalValue(p[2], MSValue(vname, VOID))
-                obj.reports.append(self.reporter(
+                self.reporter(
                     ERROR, obj, f'Value \'{vname}\' does not exist in namespace \'{namespace.name}\'.'
-                )) 
+                ) 
             else:
                 obj = ASTTerminalValue(p[2], obj)
             
@@ -1076,16 +1117,16 @@ class Parser (SlyParser):
             const = ASTDirectiveConstFromInclude(p, namespace, p[4])
         
         if self.filescope.get_element(const.value.name, MSValue) != None:
-            const.reports.append(self.reporter(
+            self.reporter(
                 ERROR, const, f'Const \'{const.value.name}\' already exists.'
-            )) 
+            ) 
         else:
             self.filescope.add_element(const.value)
         
         if not const.value.name.startswith('C_'):
-            const.reports.append(self.reporter(
+            self.reporter(
                 WARNING, const, f'Const name \'{const.value.name}\' should start with \'C_\'.'
-            )) 
+            ) 
             
         return const
     
@@ -1103,9 +1144,9 @@ class Parser (SlyParser):
             sobj = namespace.get_element(sname, MSStruct)
             if sobj == None:
                 sobj = ASTTerminalValue(p[1], MSStruct(sname, {}))
-                sobj.reports.append(self.reporter(
+                self.reporter(
                     ERROR, sobj, f'Struct \'{sname}\' does not exist in namespace \'{namespace.name}\'.'
-                )) 
+                ) 
             else:
                 sobj = ASTTerminalValue(p[1], sobj)
             
@@ -1113,9 +1154,9 @@ class Parser (SlyParser):
             struct = ASTDirectiveStructFromInclude(p, namespace, p[4])
         
         if self.filescope.get_element(struct.struct.name, MSValue) != None:
-            struct.reports.append(self.reporter(
+            self.reporter(
                 ERROR, struct, f'Struct \'{struct.struct.name}\' already exists.'
-            )) 
+            ) 
         else:
             self.filescope.add_element(struct.struct)
             self.lexer.local_structs[struct.struct.name] = struct.struct
@@ -1126,23 +1167,23 @@ class Parser (SlyParser):
     def directive_include (self, p):
         filepath = p[1]
         if filepath.type != TEXT:
-            filepath.reports.append(self.reporter(
+            self.reporter(
                 ERROR, filepath, 'File path type must be text.'
-            ))
+            )
             filepath = ''
         else:
             filepath = filepath.value.value
         
-        if filepath in NAMESPACES:
-            include = ASTDirectiveInclude(p, p[1], p[3], NAMESPACES[filepath], self.reporter, True)
+        if filepath in self.universe.namespaces:
+            include = ASTDirectiveInclude(p, p[1], p[3], self.universe.namespaces[filepath], self.reporter, True)
         else:
-            prs = Parser(self.folder)
-            prog = prs.parse_file(filepath)
+            prog = self.pool.parse_file(filepath)
+            self.dependencies.append((filepath, prog))
+            include = ASTDirectiveInclude(p, p[1], p[3], prog, self.reporter)
             if isinstance(prog, ASTProgError):
-                prog.reports.append(self.reporter(
+                self.reporter(
                     ERROR, prog, f'\'{filepath}\' was not found or did not compile.'
-                ))
-            include = ASTDirectiveInclude(p, p[1], p[3], prog, self.reporter)
+                )
             
         self.lexer.local_includes[include.name] = include.include
         return include
@@ -1163,14 +1204,15 @@ class Parser (SlyParser):
         reqctx = ASTDirectiveRequireContext(p, p[1])
         
         if self.currentscope.get_element('This', MSValue) != None:
-            reqctx.reports.append(self.reporter(
+            self.reporter(
                 ERROR, reqctx, '\'This\' has already been defined in this scope (either by a constant or by another #RequireContext).'
-            ))
+            )
         else:
             self.currentscope.add_element(MSValue('This', p[1].value, True))
             self.filescope.add_element(MSValue('@THIS', p[1].value, True))
         
             while type != None:
+                type.load()
                 for attribute in type.attributes.values():
                     self.currentscope.add_element(attribute)
                 for method in type.methods.values():
@@ -1184,26 +1226,27 @@ class Parser (SlyParser):
     def directive_extends (self, p):
         filepath = p[1]
         if filepath.type != TEXT:
-            filepath.reports.append(self.reporter(
+            self.reporter(
                 ERROR, filepath, 'File path type must be text.'
-            ))
+            )
             filepath = ''
         else:
             filepath = filepath.value.value
             
-        prs = Parser(self.folder)
-        prog = prs.parse_file(filepath)
+        prog = self.pool.parse_file(filepath)
+        self.dependencies.append((filepath, prog))
+        self.reporter.include(prog.diagnostics)
         if isinstance(prog, ASTProgError):
-            prog.reports.append(self.reporter(
+            self.reporter(
                 ERROR, prog, f'\'{filepath}\' was not found or did not compile.'
-            ))
+            )
         
         for type, objects in prog.scope.elements.items():
             for obj in objects.values():
                 if self.filescope.get_element(obj.name, type) != None:
-                    prog.reports.append(self.reporter(
+                    self.reporter(
                         ERROR, prog, f'Object \'{obj.name}\' already exists.'
-                    ))
+                    )
                 else:
                     self.filescope.add_element(obj)
                     if obj.name == '@THIS':
@@ -1218,22 +1261,22 @@ class Parser (SlyParser):
             [TokenType.LXR_DIRECTIVE_SETTING, TokenType.LXR_IDENT, TokenType.PRS_LITERAL])
     def directive_setting (self, p):
         if len(p) == 3:
-            empty = ASTTerminalEmpty(p[2].end)
+            empty = ASTTerminalEmpty(p[2].end, p[2].lines)
             setting = ASTDirectiveSetting(p, p[1], p[2], empty)
         else:
             setting = ASTDirectiveSetting(p, p[1], p[2], p[4])
         
         if self.filescope.get_element(setting.value.name, MSValue) != None:
-            setting.reports.append(self.reporter(
+            self.reporter(
                 ERROR, setting, f'Setting \'{setting.value.name}\' already exists.'
-            )) 
+            ) 
         else:
             self.filescope.add_element(setting.value)
         
         if not setting.value.name.startswith('S_'):
-            setting.reports.append(self.reporter(
+            self.reporter(
                 WARNING, setting, f'Setting name \'{setting.value.name}\' should start with \'S_\'.'
-            )) 
+            ) 
         
         return setting
 
@@ -1242,7 +1285,7 @@ class Parser (SlyParser):
             [TokenType.LXR_DIRECTIVE_COMMAND, TokenType.LXR_IDENT, TokenType.LXR_BRACKET_ROUND_OP, TokenType.PRS_TYPE, TokenType.LXR_BRACKET_ROUND_CL])
     def directive_setting (self, p):
         if len(p) == 5:
-            empty = ASTTerminalEmpty(p[4].end)
+            empty = ASTTerminalEmpty(p[4].end, p[4].lines)
             setting = ASTDirectiveCommand(p, p[1], p[3], empty)
         else:
             setting = ASTDirectiveCommand(p, p[1], p[3], p[6])
@@ -1255,7 +1298,7 @@ class Parser (SlyParser):
     @__(TokenType.PRS_MAIN,
             [TokenType.LXR_KEYWORD_MAIN, TokenType.LXR_BRACKET_ROUND_OP, TokenType.LXR_BRACKET_ROUND_CL, TokenType.PRS_EMPTY_NEW_SCOPE, TokenType.PRS_BLOCK, TokenType.PRS_EMPTY_OLD_SCOPE])
     def main (self, p):
-        main_limits = ASTTerminalEmpty.Empty(p[0].start)
+        main_limits = ASTTerminalEmpty.Empty(p[0].start, p[0].lines)
         main_type = ASTTerminalValue(main_limits, VOID)
         return ASTMain(p, main_type, p[0], p[4])
     
@@ -1271,4 +1314,44 @@ class Parser (SlyParser):
     def prog (self, p):
         declares = p[0] if isinstance(p[0], list) else []
         definitions = p[1] if isinstance(p[1], list) else []
-        return ASTProg(p, declares, definitions, p[2], self.filescope, self.reporter)
\ No newline at end of file
+        return ASTProg(p, declares, definitions, p[2], self.filescope, self.reporter)
+
+# Included files are parsed while their includer is still being parsed, so a
+# parser is only given back to the pool once its file is done. The pool grows
+# to the deepest chain of includes instead of the number of included files.
+# The pool is also the state of a compilation: the files it already went
+# through ('progs', 'None' while being compiled, so a circular include) are
+# returned as is, even if another thread compiled them again in between. A
+# pool and its parsers are only used by one thread at a time, concurrent
+# compilations each have their own and only share the universe and the
+# compiled files.
+class ParserPool:
+
+    def __init__ (self, folder, universe=None, cache_dir=None, files=None, sources=None):
+        self.folder, self.universe, self.cache_dir, self.files = folder, universe, cache_dir, files
+        self.sources = sources
+        self.parsers = list()
+        self.progs = dict()
+        self.depth = 0
+        self.created = self.acquired = 0
+
+    def acquire (self):
+        self.acquired += 1
+        if len(self.parsers) != 0:
+            return self.parsers.pop()
+
+        self.created += 1
+        return Parser(self.folder, self.universe, pool=self, cache_dir=self.cache_dir, files=self.files, sources=self.sources)
+
+    def release (self, parser):
+        self.parsers.append(parser)
+
+    def parse_file (self, filepath):
+        parser = self.acquire()
+        try:
+            return parser.parse_file(filepath)
+        finally:
+            self.release(parser)
+
+    def stats (self):
+        return { 'created': self.created, 'acquired': self.acquired, 'idle': len(self.parsers) }
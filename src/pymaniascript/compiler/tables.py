@@ -0,0 +1,54 @@
+from sly.yacc import LRTable
+from hashlib import sha1
+import os
+import pickle
+import sly
+import threading
+
+__FORMAT   = 1
+__FILENAME = os.path.dirname(__file__) + os.sep + 'parser.cache'
+
+class CachedTable:
+
+    def __init__ (self, grammar, lr_action, lr_goto, defaulted_states):
+        self.grammar, self.lr_productions = grammar, grammar.Productions
+        self.lr_action, self.lr_goto, self.defaulted_states = lr_action, lr_goto, defaulted_states
+        self.sr_conflicts, self.rr_conflicts = [], []
+
+def get_tables_filename ():
+    return __FILENAME
+
+def get_grammar_key (grammar):
+    # Tables only depend on the productions, their precedence and the start symbol
+    productions = [ (str(p), p.prec) for p in grammar.Productions ]
+    precedence = sorted(grammar.Precedence.items())
+    data = repr((productions, precedence, sorted(grammar.Terminals), grammar.Start))
+    return f'{sly.__version__}:{sha1(data.encode()).hexdigest()}'
+
+def load_tables (grammar):
+    try:
+        with open(get_tables_filename(), 'rb') as f:
+            if pickle.load(f) != (__FORMAT, get_grammar_key(grammar)): return None
+            lr_action, lr_goto, defaulted_states = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+
+    return CachedTable(grammar, lr_action, lr_goto, defaulted_states)
+
+def save_tables (grammar, table):
+    filename = get_tables_filename()
+    temporary = f'{filename}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(temporary, 'wb') as f:
+            pickle.dump((__FORMAT, get_grammar_key(grammar)), f)
+            pickle.dump((table.lr_action, table.lr_goto, table.defaulted_states), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, filename)
+    except (OSError, pickle.PicklingError):
+        if os.path.exists(temporary): os.remove(temporary)
+
+def compute_tables (grammar):
+    table = load_tables(grammar)
+    if table == None:
+        table = LRTable(grammar)
+        save_tables(grammar, table)
+    return table
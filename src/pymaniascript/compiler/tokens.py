@@ -185,5 +185,4 @@ class TokenType (Enum):
     def is_parser (self):         return self.name.startswith('PRS')
     def is_precedence (self):     return self.name.startswith('PRC')
     def is_empty (self):          return self.name.startswith('PRS_EMPTY')
-    def is_lexer_ignored (self):  return self in [TokenType.LXR_WHITESPACE]
-    def is_parser_ignored (self): return self in [TokenType.LXR_COMMENT]
\ No newline at end of file
+    def is_lexer_ignored (self):  return self in [TokenType.LXR_WHITESPACE, TokenType.LXR_COMMENT]
\ No newline at end of file
@@ -0,0 +1,165 @@
+from pymaniascript.compiler.parser import ParserPool
+from pymaniascript.compiler.files import FileCache
+from pymaniascript.compiler.graph import DependencyGraph
+from pymaniascript.ast.report import FATAL_ERROR, ERROR, WARNING
+from pymaniascript.msobjects import UNIVERSE
+import inspect
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+
+PARSE_ERROR, INVALID_REQUEST, METHOD_NOT_FOUND, INVALID_PARAMS, SERVER_ERROR = -32700, -32600, -32601, -32602, -32000
+
+class DaemonError (Exception):
+
+    def __init__ (self, code, msg):
+        super().__init__(msg)
+        self.code = code
+
+def report_to_dict (report):
+    start, end = report.offender.get_start(), report.offender.get_end()
+    return { 'file': report.filename, 'level': report.level.name, 'message': report.msg,
+             'start': [start.ln, start.col], 'end': [end.ln, end.col] }
+
+# Keeps a universe, the parser tables and the compiled files of a Scripts
+# folder in memory and answers JSON-RPC requests, one JSON object per line.
+# Requests are handled one at a time. The folder is polled for changes, and
+# the files clients asked for are compiled again as soon as they or one of
+# their includes change, so the next request finds them ready.
+class Daemon:
+
+    def __init__ (self, root_folder, universe=None, cache_dir=None, files=None):
+        self.root_folder = os.path.abspath(root_folder)
+        self.universe = universe if universe != None else UNIVERSE
+        self.files = files if files != None else FileCache()
+        self.pool = ParserPool(self.root_folder, self.universe, cache_dir, self.files)
+        self.graph = DependencyGraph(self.root_folder, self.universe)
+        self.graph.refresh()
+        self.compiled = set()
+        self.lock = threading.RLock()
+        self.running = True
+        self.methods = { 'compile': self.compile, 'reports': self.reports, 'refresh': self.refresh,
+                         'stats': self.stats, 'shutdown': self.shutdown }
+
+    def get_filepath (self, file):
+        full_filename = os.path.abspath(os.path.join(self.root_folder, file))
+        if os.path.commonpath([full_filename, self.root_folder]) != self.root_folder:
+            raise DaemonError(INVALID_PARAMS, f'\'{file}\' is not in \'{self.root_folder}\'.')
+        return os.path.relpath(full_filename, self.root_folder).replace(os.sep, '/')
+
+    def compile (self, file, ast=False):
+        filepath = self.get_filepath(file)
+        with self.lock:
+            start = time.perf_counter()
+            prog = self.pool.parse_file(filepath)
+            self.compiled.add(filepath)
+            result = { 'file': filepath, 'reports': [ report_to_dict(report) for report in prog.reports ] }
+            result['duration'] = time.perf_counter() - start
+            if ast: result['ast'] = str(prog)
+
+        result['errors'] = sum( 1 for report in prog.reports if report.level in [ERROR, FATAL_ERROR] )
+        result['warnings'] = sum( 1 for report in prog.reports if report.level == WARNING )
+        return result
+
+    def reports (self, file):
+        return self.compile(file)['reports']
+
+    def refresh (self):
+        with self.lock:
+            changed = self.graph.refresh()
+            if len(changed) == 0:
+                return { 'changed': [], 'compiled': [] }
+
+            affected = self.graph.affected(changed) | changed
+            for filepath in affected:
+                self.files.invalidate(os.path.join(self.root_folder, filepath))
+
+            # Included files first, so each of them is only compiled once
+            compiled = [ filepath for filepath in self.compiled & affected if filepath in self.graph.files ]
+            compiled.sort(key=lambda filepath: len(self.graph.dependencies(filepath, True)))
+            for filepath in compiled:
+                self.pool.parse_file(filepath)
+            self.compiled &= set(self.graph.files)
+
+        return { 'changed': sorted(changed), 'compiled': compiled }
+
+    def stats (self):
+        return { 'root': self.root_folder, 'files': self.files.stats(), 'parsers': self.pool.stats(),
+                 'watched': len(self.graph.files), 'compiled': len(self.compiled) }
+
+    def shutdown (self):
+        self.running = False
+        return True
+
+    def watch (self, interval=0.5):
+        while self.running:
+            time.sleep(interval)
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f'Refresh failed: {type(e).__name__}: {e}', file=sys.stderr)
+
+    def start_watching (self, interval=0.5):
+        thread = threading.Thread(target=self.watch, args=(interval,), daemon=True)
+        thread.start()
+        return thread
+
+    def handle (self, line):
+        request_id = None
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                raise DaemonError(PARSE_ERROR, 'Request is not valid JSON.')
+            if not isinstance(request, dict) or not isinstance(request.get('method', None), str):
+                raise DaemonError(INVALID_REQUEST, 'Request must be an object with a \'method\'.')
+
+            request_id = request.get('id', None)
+            method = self.methods.get(request['method'], None)
+            if method == None:
+                raise DaemonError(METHOD_NOT_FOUND, f'Unknown method \'{request["method"]}\'.')
+
+            params = request.get('params', dict())
+            args, kwargs = (params, dict()) if isinstance(params, list) else (list(), params)
+            try:
+                inspect.signature(method).bind(*args, **kwargs)
+            except TypeError as e:
+                raise DaemonError(INVALID_PARAMS, str(e))
+            result = method(*args, **kwargs)
+            response = { 'jsonrpc': '2.0', 'id': request_id, 'result': result }
+        except DaemonError as e:
+            response = { 'jsonrpc': '2.0', 'id': request_id, 'error': { 'code': e.code, 'message': str(e) } }
+        except Exception as e:
+            response = { 'jsonrpc': '2.0', 'id': request_id, 'error': { 'code': SERVER_ERROR, 'message': f'{type(e).__name__}: {e}' } }
+        return json.dumps(response)
+
+    def serve_stream (self, infile, outfile):
+        for line in infile:
+            if line.strip() == '': continue
+            outfile.write(self.handle(line) + '\n')
+            outfile.flush()
+            if not self.running: break
+
+    def serve_socket (self, path):
+        daemon = self
+
+        class Handler (socketserver.StreamRequestHandler):
+            def handle (self):
+                for line in self.rfile:
+                    if line.strip() == b'': continue
+                    self.wfile.write(daemon.handle(line.decode()).encode() + b'\n')
+                    self.wfile.flush()
+                    if not daemon.running:
+                        threading.Thread(target=server.shutdown).start()
+                        break
+
+        if os.path.exists(path): os.remove(path)
+        with socketserver.ThreadingUnixStreamServer(path, Handler) as server:
+            server.daemon_threads = True
+            try:
+                server.serve_forever()
+            finally:
+                if os.path.exists(path): os.remove(path)
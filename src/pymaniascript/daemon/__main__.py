@@ -0,0 +1,33 @@
+import os
+import sys
+import argparse
+
+parser = argparse.ArgumentParser(prog='\n  python -m pymaniascript.daemon',
+                                 formatter_class=argparse.RawDescriptionHelpFormatter,
+                                 description='description:\n  Keeps the compiler loaded and answers JSON-RPC requests (one JSON object per line) about the scripts of a folder.',
+                                 epilog='Methods: compile {file, ast}, reports {file}, refresh, stats and shutdown.\nFiles are given relative to the root folder. To query a daemon listening on a socket:\n  python -m pymaniascript.client -s socket [-ew] scriptfile')
+
+parser.add_argument('rootfolder'    , help='Path to your \'Scripts\' folder')
+parser.add_argument('-s', help='Path of the Unix socket to listen on (defaults to stdin/stdout)', metavar='socket', dest='socket')
+parser.add_argument('-i', help='Seconds between two checks of the folder for changes (defaults to 0.5, 0 disables them)', metavar='interval', dest='interval', type=float, default=0.5)
+parser.add_argument('-d', help='Path to the \'doc.h\' to compile against (defaults to the one generated in pymaniascript.doch)', metavar='doch', dest='doch')
+parser.add_argument('-c', help='Folder where compiled files are cached between runs (defaults to $PYMANIASCRIPT_CACHE_DIR, disabled if unset)', metavar='cachedir', dest='cachedir')
+args = parser.parse_args()
+
+if not os.path.isdir(args.rootfolder):
+    print('You must provide a folder!')
+    exit()
+
+from . import Daemon
+from pymaniascript.msobjects import TypeUniverse
+
+universe = TypeUniverse(os.path.abspath(args.doch)) if args.doch else None
+daemon = Daemon(args.rootfolder, universe, args.cachedir)
+if args.interval > 0:
+    daemon.start_watching(args.interval)
+
+if args.socket:
+    print(f'Listening on \'{args.socket}\' for \'{daemon.root_folder}\'.', file=sys.stderr)
+    daemon.serve_socket(args.socket)
+else:
+    daemon.serve_stream(sys.stdin, sys.stdout)
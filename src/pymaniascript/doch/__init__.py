@@ -1,29 +1,52 @@
-from CppHeaderParser import CppHeader, CppParseError
+from hashlib import sha1
+import os
+from pymaniascript import __version__
 
 NAMESPACE = '__NAMESPACE__'
-__DOCH = None
 __ENUM_WRONG_VALUES = ['*unused*', '(reserved)', 'XXX Null']
 __DOCH_FILENAME = __file__[:-11] + 'doc.h'
 
-def __compute_doch (filename=None):
-    global __DOCH
-    
-    filename = filename if filename else __DOCH_FILENAME
+def __not_found ():
+    print('\'doc.h\' has not been found. Please run \'python -m pymaniascript.doch <your TM2020 exe path>\'.')
+    exit()
+
+def __read_doch (filename, mode='r'):
     try:
-        with open(filename, 'r') as f: data = f.read()
+        with open(filename, mode) as f: return f.read()
     except FileNotFoundError:
-        print('\'doc.h\' has not been found. Please run \'python -m pymaniascript.doch <your TM2020 exe path>\'.')
-        exit()
-    
+        __not_found()
+
+def __compute_doch_cppheaderparser (filename):
+    from CppHeaderParser import CppHeader, CppParseError
+
+    data = __read_doch(filename)
+
     for ewv in __ENUM_WRONG_VALUES: data = data.replace(f'{ewv},\n', '')
     data = data.replace('namespace ', f'class {NAMESPACE}')
-    
+
     try:
-        __DOCH = CppHeader(data, argType='string').classes
+        return CppHeader(data, argType='string').classes
     except CppParseError as e:
         raise Exception(f'Exception while parsing file \'{filename}\': {e}')
 
-def get_doch (filename=None):
-    if __DOCH == None:
-        __compute_doch(filename)
-    return __DOCH
\ No newline at end of file
+def __compute_doch_stream (filename):
+    from .reader import read_doch
+
+    try:
+        return read_doch(filename, __ENUM_WRONG_VALUES, NAMESPACE)
+    except FileNotFoundError:
+        __not_found()
+
+BACKENDS = { 'cppheaderparser': __compute_doch_cppheaderparser,
+             'stream'         : __compute_doch_stream }
+BACKEND = os.environ.get('PYMANIASCRIPT_DOCH_BACKEND', 'cppheaderparser')
+
+def get_doch_filename (filename=None):
+    return filename if filename else __DOCH_FILENAME
+
+def get_doch_key (filename=None):
+    data = __read_doch(get_doch_filename(filename), 'rb')
+    return f'{__version__}:{sha1(data).hexdigest()}'
+
+def compute_doch (filename=None, backend=None):
+    return BACKENDS[backend or BACKEND](get_doch_filename(filename))
\ No newline at end of file
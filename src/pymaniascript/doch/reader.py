@@ -0,0 +1,148 @@
+from functools import lru_cache
+import re
+
+__SPLITTER = re.compile(r'([;{}])')
+__ACCESS = re.compile(r'^(public|private|protected)\s*:\s*')
+__HEADER = re.compile(r'\b(class|struct|namespace|enum)\s+(\w+)(\s*:\s*(public|private|protected)?\s*(\w+))?\s*$')
+__METHOD = re.compile(r'^(.*?)\b(operator\s*\S+?|\w+)\s*\((.*)\)\s*(const)?$', re.DOTALL)
+__TYPE_TOKEN = re.compile(r'\w+(?:\s*::\s*\w+)*|[<>,]')
+__NAME = re.compile(r'(\w+)$')
+__CONST = re.compile(r'(^|[^>\s])\s*\bconst(\W|$)')
+__TEMPLATE_ARGS = re.compile(r'<.*>')
+
+def __new_record (inherits):
+    return { 'inherits'  : [ {'class': inherits} ] if inherits != None else [],
+             'enums'     : { 'public': [], 'private': [], 'protected': [] },
+             'properties': { 'public': [], 'private': [], 'protected': [] },
+             'methods'   : { 'public': [], 'private': [], 'protected': [] } }
+
+@lru_cache(maxsize=None)
+def normalize_type (text):
+    tokens = [token.replace(' ', '') for token in __TYPE_TOKEN.findall(text) if token != 'const']
+
+    def parse (i):
+        name, i = tokens[i], i + 1
+        if i < len(tokens) and tokens[i] == '<':
+            args = []
+            while tokens[i] != '>':
+                arg, i = parse(i + 1)
+                args.append(arg)
+            name, i = f'{name}<{", ".join(args)} >', i + 1
+        return name, i
+
+    return parse(0)[0] if len(tokens) != 0 else ''
+
+def __split_arguments (text):
+    args, depth, start = [], 0, 0
+    for i, char in enumerate(text):
+        if   char == '<': depth += 1
+        elif char == '>': depth -= 1
+        elif char == ',' and depth == 0:
+            args.append(text[start:i])
+            start = i + 1
+    args.append(text[start:])
+    return [ arg for arg in args if arg.strip() not in ['', 'void'] ]
+
+# As with CppHeaderParser (both backends share doc.h.cache), a 'const' right
+# after template arguments does not make the member constant. Types are only
+# spelled differently, 'const' and spaces being ignored once resolved.
+def __split_declaration (text):
+    text = text.split('=')[0].strip()
+    name = __NAME.search(text).group(1)
+    type = text[:-len(name)]
+    if type.strip() in ['', 'const']: type, name = text, ''
+    return type, name, __CONST.search(__TEMPLATE_ARGS.sub('<>', type)) != None
+
+def __statements (lines):
+    in_comment = False
+
+    for line in lines:
+        code = ''
+        while len(line) != 0:
+            if in_comment:
+                end = line.find('*/')
+                in_comment, line = end == -1, '' if end == -1 else line[end+2:]
+            else:
+                start, comment = line.find('/*'), line.find('//')
+                if comment != -1 and (start == -1 or comment < start):
+                    code, line = code + line[:comment], ''
+                elif start != -1:
+                    code, line, in_comment = code + line[:start] + ' ', line[start+2:], True
+                else:
+                    code, line = code + line, ''
+
+        yield from __SPLITTER.split(code)
+
+def read_doch (filename, wrong_enum_values, namespace_prefix):
+    records = dict()
+    stack = []
+    pending = ''
+
+    with open(filename, 'r') as f:
+        for piece in __statements(f):
+            if piece not in [';', '{', '}']:
+                pending += piece
+                continue
+
+            statement, pending = ' '.join(pending.split()), ''
+            scope = stack[-1] if len(stack) != 0 else None
+
+            while scope != None and scope[0] != 'enum':
+                match = __ACCESS.match(statement)
+                if match == None: break
+                scope[2] = match.group(1)
+                statement = statement[match.end():]
+
+            if piece == '{':
+                match = __HEADER.search(statement)
+                kind, name = match.group(1, 2) if match != None else ('block', None)
+
+                if kind == 'enum':
+                    stack.append(['enum', name, None])
+                elif kind in ['class', 'struct', 'namespace']:
+                    record_name = namespace_prefix + name if kind == 'namespace' else name
+                    records[record_name] = __new_record(match.group(5))
+                    stack.append([kind, records[record_name], 'public' if kind == 'struct' else 'private'])
+                else:
+                    stack.append(['block', None, None])
+
+            elif piece == '}':
+                if scope == None: continue
+                stack.pop()
+
+                if scope[0] == 'enum':
+                    values = [ value.split('=')[0].strip() for value in statement.split(',') ]
+                    values = [ {'name': value} for value in values if value != '' and value not in wrong_enum_values ]
+                    owner = stack[-1] if len(stack) != 0 else None
+                    if owner != None and owner[0] != 'block':
+                        owner[1]['enums'][owner[2]].append({ 'name': scope[1], 'values': values })
+
+                elif statement != '' and scope[0] != 'block':
+                    __add_member(scope, statement)
+
+            elif statement != '' and scope != None and scope[0] not in ['enum', 'block']:
+                __add_member(scope, statement)
+
+    return records
+
+def __add_member (scope, statement):
+    _, record, access = scope
+
+    if statement.startswith(('typedef', 'friend', 'using', 'template')):
+        return
+
+    match = __METHOD.match(statement)
+    if match != None:
+        rtype, name, args, _ = match.groups()
+        parameters = []
+        for arg in __split_arguments(args):
+            type, argname, _ = __split_declaration(arg)
+            parameters.append({ 'type': normalize_type(type), 'name': argname })
+
+        record['methods'][access].append({ 'name': name.replace(' ', ''), 'rtnType': normalize_type(rtype),
+                                           'parameters': parameters })
+    else:
+        type, name, const = __split_declaration(statement)
+        type = normalize_type(type)
+        record['properties'][access].append({ 'type': f'const {type}' if const else type, 'name': name,
+                                              'constant': 1 if const else 0 })
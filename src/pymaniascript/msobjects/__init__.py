@@ -4,11 +4,10 @@ from .msobject import (MSClass, MSValue, get_array, MSEnum  , MSFunction ,
                        TRUE   , FALSE  , NULL     , NULLID  , ANY        ,
                        MSType , MSArray, MSInclude, MSStruct, MSLabel)
 
-from .classes import compute_classes, CLASSES
-from .namespaces import compute_namespaces, NAMESPACES
+from .universe import TypeUniverse
 
-compute_classes(); compute_namespaces()
-del compute_classes, compute_namespaces
+UNIVERSE = TypeUniverse()
+CLASSES, NAMESPACES = UNIVERSE.classes, UNIVERSE.namespaces
 
 CAST        = MSFunction('cast'       , [                       ])
 LOG         = MSFunction('log'        , [ (ANY    , VOID)       ])
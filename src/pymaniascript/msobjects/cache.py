@@ -0,0 +1,93 @@
+from .msobject   import (MSObject, MSClass, MSEnum    , MSArray,
+                        get_array, ANY    , VOID, TYPEMAPPING)
+
+from pymaniascript.doch import get_doch_filename, get_doch_key
+from functools import partial
+import os
+import pickle
+import threading
+
+__BUILTINS = { **TYPEMAPPING, ANY.name: ANY }
+__RESOLVER = '@RESOLVER'
+__FORMAT   = 2
+
+def __reduce_class (_class):
+    return (MSClass, (_class.name, _class.parent))
+
+def __reduce_enum (enum):
+    return (MSEnum, (enum.name, list(enum.values)))
+
+def __reduce_array (array):
+    return (get_array, (array.elemtype, array.keytype if array.associative != 0 else VOID))
+
+def __persistent_id (universe, obj):
+    if isinstance(obj, MSObject) and __BUILTINS.get(obj.name, None) is obj:
+        return obj.name
+    elif obj is universe.resolver:
+        return __RESOLVER
+    return None
+
+def __persistent_load (universe, pid):
+    return universe.resolver if pid == __RESOLVER else __BUILTINS[pid]
+
+def get_cache_filename (filename=None):
+    return get_doch_filename(filename) + '.cache'
+
+# The class names are stored first, so they can be read alone
+def load_class_names (universe):
+    filename = universe.filename
+
+    try:
+        with open(get_cache_filename(filename), 'rb') as f:
+            if pickle.load(f) != (__FORMAT, get_doch_key(filename)): return None
+            return pickle.load(f)
+    except Exception:
+        return None
+
+def load_universe (universe):
+    filename = universe.filename
+
+    try:
+        with open(get_cache_filename(filename), 'rb') as f:
+            if pickle.load(f) != (__FORMAT, get_doch_key(filename)): return False
+            pickle.load(f)
+
+            unpickler = pickle.Unpickler(f)
+            unpickler.persistent_load = partial(__persistent_load, universe)
+            classes, states, namespaces = unpickler.load()
+    except Exception:
+        # A stale or incompatible cache is rebuilt from doc.h
+        return False
+
+    for _class, state in zip(classes, states):
+        _class.__dict__.update(state)
+        universe.classes[_class.name] = _class
+
+    universe.namespaces.update(namespaces)
+    return True
+
+def save_universe (universe):
+    filename = universe.filename
+
+    # Class skeletons are stored before their members so that arrays and enums
+    # never see a class without its name while unpickling.
+    classes = list(universe.classes.values())
+    states = [ { key: value for key, value in _class.__dict__.items() if key not in ['name', 'parent'] }
+               for _class in classes ]
+
+    cache_filename = get_cache_filename(filename)
+    temporary = f'{cache_filename}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(temporary, 'wb') as f:
+            pickle.dump((__FORMAT, get_doch_key(filename)), f)
+            pickle.dump([ _class.name for _class in classes ], f)
+
+            pickler = pickle.Pickler(f, pickle.HIGHEST_PROTOCOL)
+            pickler.persistent_id = partial(__persistent_id, universe)
+            pickler.dispatch_table = { MSClass: __reduce_class,
+                                       MSEnum : __reduce_enum ,
+                                       MSArray: __reduce_array }
+            pickler.dump((classes, states, dict(universe.namespaces)))
+        os.replace(temporary, cache_filename)
+    except (OSError, pickle.PicklingError):
+        if os.path.exists(temporary): os.remove(temporary)
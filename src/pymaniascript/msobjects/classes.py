@@ -1,94 +1,82 @@
-from .msobject import (MSClass   , MSValue    , get_array, MSEnum ,
-                       MSFunction, TYPEMAPPING)
+from .msobject import MSClass, MSValue, MSEnum, MSFunction
 
-from pymaniascript.doch import get_doch, NAMESPACE
-
-CLASSES = dict()
+from pymaniascript.doch import NAMESPACE
+from functools import partial
 
 __PREPROCESSED = ['Void', 'Integer', 'Real', 'Boolean', 'Text', 'Vec2', 'Vec3', 'Int2', 'Int3', 'Ident', 'Array', 'AssociativeArray']
 
-def __compute_type (name):
-    if   name in TYPEMAPPING:
-        return TYPEMAPPING[name]
-    
-    elif name in CLASSES:
-        return CLASSES[name]
-    
-    elif name.startswith('Array'):
-        elemtype = __compute_type(name[6:-2])
-        return get_array(elemtype)
+def __compute_members (resolver, record, _class, level):
+    enums, attributes, methods = record
     
-    elif name.startswith('AssociativeArray'):
-        elemtype, keytype = name[17:-2].split(', ')
-        elemtype, keytype = __compute_type(elemtype), __compute_type(keytype)
-        return get_array(elemtype, keytype)
+    if level == MSClass.ENUMS:
+        for enum_name, values in enums:
+            _class.enums[enum_name] = MSEnum(enum_name, values)
+        return
     
-    elif '::' in name:
-        class_name, enum_name = name.split('::')
-        return CLASSES[class_name].get_enum(enum_name)
-    
-    else:
-        raise Exception(f'Invalid type in doch: {name}')
-
-def compute_classes (filename=None):
-    if len(CLASSES) != 0: return
+    for type, name, const in attributes:
+        type = resolver.resolve(type)
+        
+        computed_attr = MSValue(name, type, const)
+        _class.attributes[name] = computed_attr
     
-    doch = get_doch(filename)
-    doch_classes = { class_name: class_data for class_name, class_data in doch.items() if
-                     not (class_name in __PREPROCESSED or class_name.startswith(NAMESPACE)) }
+    for name, rtype, args in methods:
+        rtype = resolver.resolve(rtype)
+        method_obj = _class.methods.get(name, None)
+        signature = tuple(resolver.resolve(arg) for arg in args)
+        signature = (*signature, rtype)
+        
+        if method_obj == None:
+            # An overload keeps the signatures of the parent, which is left as is
+            inherited = _class.parent.get_method(name) if _class.parent != None else None
+            signatures = list(inherited.signatures) if inherited != None else []
+            method_obj = MSFunction(name, signatures=[ *signatures, signature ])
+            _class.methods[name] = method_obj
+        else:
+            method_obj.signatures.append( signature )
 
-    # Preallocate classes
-    processed = {class_name: False for class_name in doch_classes}
+def compute_class_records (doch):
+    records = dict()
     
-    while False in processed.values():
-        for class_name in processed:
-            if processed[class_name]: continue
-            
-            inherits = doch[class_name]['inherits']
-            if len(inherits) == 0:
-                _class = MSClass(class_name)
-                CLASSES[class_name] = _class
-            else:
-                parent_name = inherits[0]['class']
-                if parent_name not in CLASSES: continue
-                
-                parent = CLASSES[parent_name]
-                _class = MSClass(class_name, parent=parent)
-                CLASSES[class_name] = _class
-            
-            processed[class_name] = True
-    
-    # Compute enums
-    for class_name, class_data in doch_classes.items():
-        _class = CLASSES[class_name]
+    for class_name, class_data in doch.items():
+        if class_name in __PREPROCESSED or class_name.startswith(NAMESPACE): continue
+        
+        inherits = class_data['inherits']
+        parent_name = inherits[0]['class'] if len(inherits) != 0 else None
         
-        for enum_data in class_data['enums']['public']:
-            enum = MSEnum(enum_data['name'], [value['name'] for value in enum_data['values']])
-            _class.enums[enum.name] = enum
+        enums = [ (str(enum_data['name']), [value['name'] for value in enum_data['values']])
+                  for enum_data in class_data['enums']['public'] ]
+        attributes = [ (attribute['type'], str(attribute['name']), attribute['constant']==1)
+                       for attribute in class_data['properties']['public'] ]
+        methods = [ (method['name'], method['rtnType'], [arg['type'] for arg in method['parameters']])
+                    for method in class_data['methods']['public'] ]
+        
+        records[class_name] = (parent_name, (enums, attributes, methods))
+    
+    return records
 
-    # Compute attributes
-    for class_name, class_data in doch_classes.items():
-        _class = CLASSES[class_name]
+def compute_classes (universe, records):
+    classes = universe.classes
+    if len(classes) != 0: return
+
+    # Preallocate classes, parents before their children
+    for class_name in records:
+        chain = dict()
         
-        for attribute in class_data['properties']['public']:
-            type = attribute['type']
-            name = attribute['name']
-            
-            if type.startswith('const'): type = type[6:]
-            type = __compute_type(type)
+        while class_name != None and class_name not in classes:
+            if class_name in chain:
+                cycle = list(chain)[list(chain).index(class_name):] + [class_name]
+                raise Exception(f'Cyclic inheritance in doch: {" -> ".join(cycle)}')
+            if class_name not in records:
+                raise Exception(f'Class \'{list(chain)[-1]}\' inherits from unknown class \'{class_name}\' in doch.')
             
-            computed_attr = MSValue(name, type, attribute['constant']==1)            
-            _class.attributes[name] = computed_attr
+            chain[class_name] = None
+            class_name = records[class_name][0]
         
-        for method in class_data['methods']['public']:
-            name = method['name']
-            rtype = __compute_type(method['rtnType'])
-            method_obj = _class.get_method(name)
-            signature = tuple(__compute_type(arg['type']) for arg in method['parameters'])
-            signature = (*signature, rtype)
-            
-            if method_obj == None:
-                method_obj = MSFunction(name, signatures=[ signature ])
-                _class.methods[name] = method_obj
-            else:
-                method_obj.signatures.append( signature )
\ No newline at end of file
+        parent = classes[class_name] if class_name != None else None
+        for child_name in reversed(list(chain)):
+            parent = MSClass(child_name, parent=parent)
+            classes[child_name] = parent
+    
+    # Attach members, computed on first lookup
+    for class_name, (_, record) in records.items():
+        classes[class_name].loader = partial(__compute_members, universe.resolver, record)
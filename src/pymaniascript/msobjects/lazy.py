@@ -0,0 +1,57 @@
+import threading
+
+# The thread running the loader sees the dict as it is filled, other threads
+# wait for the loader to be done. Dicts loaded together share their lock. A
+# loader that fails is kept, and the dict stays empty until it succeeds.
+class LazyDict (dict):
+
+    def __init__ (self, loader=None, lock=None):
+        super().__init__()
+        self.loader, self.loaded = loader, loader == None
+        self.lock = lock if lock != None else threading.RLock()
+
+    def load (self):
+        if self.loaded: return
+
+        with self.lock:
+            if self.loader != None:
+                loader, self.loader = self.loader, None
+                try:
+                    loader()
+                except:
+                    super().clear()
+                    self.loader = loader
+                    raise
+                self.loaded = True
+
+    def __getitem__ (self, key):
+        self.load()
+        return super().__getitem__(key)
+
+    def __contains__ (self, key):
+        self.load()
+        return super().__contains__(key)
+
+    def __iter__ (self):
+        self.load()
+        return super().__iter__()
+
+    def __len__ (self):
+        self.load()
+        return super().__len__()
+
+    def get (self, key, default=None):
+        self.load()
+        return super().get(key, default)
+
+    def keys (self):
+        self.load()
+        return super().keys()
+
+    def values (self):
+        self.load()
+        return super().values()
+
+    def items (self):
+        self.load()
+        return super().items()
@@ -1,3 +1,5 @@
+import threading
+
 class MSObject:
     
     def __init__ (self, name):
@@ -210,14 +212,19 @@ class MSArray (MSType):
     def has_null(self):
         return self.elemtype.has_null() or self.keytype.has_null()
 
+# Arrays are compared by identity, so two threads must never create the same one
 __ARRAYS = {}
+__ARRAYS_LOCK = threading.RLock()
 def get_array (elemtype, keytype=VOID):
     key = (elemtype, keytype)
     array = __ARRAYS.get(key, None)
     
     if array == None:
-        array = MSArray(elemtype, keytype)
-        __ARRAYS[key] = array
+        with __ARRAYS_LOCK:
+            array = __ARRAYS.get(key, None)
+            if array == None:
+                array = MSArray(elemtype, keytype)
+                __ARRAYS[key] = array
     
     return array
 
@@ -236,8 +243,37 @@ class MSEnum (MSType):
 
 class MSClass (MSType):
     
-    def __init__ (self, name, parent=None):
+    ENUMS, MEMBERS = 1, 2
+    LOCK = threading.RLock()
+    
+    def __init__ (self, name, parent=None, loader=None):
         super().__init__(name, parent=parent)
+        self.loader, self.loaded = loader, 0
+    
+    # A level only counts as loaded once its members are all there, so other
+    # threads wait for it instead of seeing a class being filled
+    def load (self, level=MEMBERS):
+        if self.loaded >= level or self.loader == None: return
+        
+        with MSClass.LOCK:
+            while self.loader != None and self.loaded < level:
+                self.loader(self, self.loaded + 1)
+                self.loaded += 1
+            
+            if self.loaded >= MSClass.MEMBERS:
+                self.loader = None
+    
+    def get_attribute (self, name):
+        self.load()
+        return super().get_attribute(name)
+    
+    def get_method (self, name):
+        self.load()
+        return super().get_method(name)
+    
+    def get_enum (self, name):
+        self.load(MSClass.ENUMS)
+        return super().get_enum(name)
     
     def has_null (self):
         return self == NULL.type
@@ -0,0 +1,84 @@
+from .msobject import get_array, MSEnum, MSInclude, MSClass, TYPEMAPPING
+
+import re
+
+class TypeResolver:
+
+    TOKEN = re.compile(r'\w+(?:\s*::\s*\w+)*|[<>,]')
+
+    def __init__ (self, classes, namespaces):
+        self.classes, self.namespaces = classes, namespaces
+        self.types = dict()
+        self.hits = self.misses = 0
+
+    def resolve (self, name, scope=None):
+        key = (name, scope.name) if scope != None else name
+        type = self.types.get(key, None)
+        if type != None or key in self.types:
+            self.hits += 1
+            return type
+        self.misses += 1
+
+        tokens = [ token.replace(' ', '') for token in TypeResolver.TOKEN.findall(name) if token != 'const' ]
+        try:
+            type, end = self.__parse(tokens, 0, scope)
+        except (IndexError, KeyError):
+            end = -1
+        if end != len(tokens):
+            raise Exception(f'Invalid type in doch: {name}')
+
+        self.types[key] = type
+        return type
+
+    def stats (self):
+        return { 'hits': self.hits, 'misses': self.misses, 'size': len(self.types) }
+
+    def clear (self):
+        self.types.clear()
+        self.hits = self.misses = 0
+
+    def __parse (self, tokens, i, scope):
+        name, args, i = tokens[i], [], i + 1
+        if name in ['<', '>', ',']: raise KeyError(name)
+
+        if i < len(tokens) and tokens[i] == '<':
+            while tokens[i] != '>':
+                arg, i = self.__parse(tokens, i + 1, scope)
+                args.append(arg)
+            i += 1
+
+        return self.__lookup(name, args, scope), i
+
+    def __lookup (self, name, args, scope):
+        if   name == 'Array' and len(args) == 1:
+            return get_array(args[0])
+
+        elif name == 'AssociativeArray' and len(args) == 2:
+            elemtype, keytype = args
+            return get_array(elemtype, keytype)
+
+        elif len(args) != 0:
+            raise KeyError(name)
+
+        elif name in TYPEMAPPING:
+            return TYPEMAPPING[name]
+
+        elif name in self.namespaces:
+            return self.namespaces[name]
+
+        elif name in self.classes:
+            return self.classes[name]
+
+        elif '::' in name:
+            parent_name, enum_name = name.rsplit('::', 1)
+            parent = self.__lookup(parent_name, [], scope)
+            if   isinstance(parent, MSInclude):
+                return parent.get_element(enum_name, MSEnum)
+            elif isinstance(parent, MSClass):
+                return parent.get_enum(enum_name)
+
+        elif scope != None:
+            return self.__lookup(scope.name + '::' + name, [], None)
+
+        else:
+            raise KeyError(name)
@@ -0,0 +1,276 @@
+from .classes    import compute_classes
+from .namespaces import compute_namespaces
+
+from pymaniascript.doch import get_doch_key
+import mmap
+import os
+import struct
+import threading
+
+# Layout: a header, then 9 sections of fixed-size little-endian entries.
+# Every name and type string is interned once in the string table. Records,
+# attributes, methods and enums are sorted by name, so lookups bisect the
+# mapping in place instead of building Python objects.
+
+class TypeDatabase:
+
+    MAGIC, FORMAT = b'MSDB', 1
+
+    (STRING_OFFSETS, STRING_DATA, CLASSES   , NAMESPACES,
+     ENUMS         , VALUES     , ATTRIBUTES, METHODS   , ARGUMENTS) = range(9)
+
+    HEADER    = struct.Struct('<4sII18I')
+    INDEX     = struct.Struct('<I')
+    RECORD    = struct.Struct('<IiIIIIII')
+    ENUM      = struct.Struct('<III')
+    ATTRIBUTE = struct.Struct('<III')
+    METHOD    = struct.Struct('<IIII')
+    BYTE      = struct.Struct('<B')
+
+    SECTIONS = [INDEX, BYTE, RECORD, RECORD, ENUM, INDEX, ATTRIBUTE, METHOD, INDEX]
+
+    def __init__ (self, filename):
+        with open(filename, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, format, key, *sections = TypeDatabase.HEADER.unpack_from(self.map, 0)
+        if magic != TypeDatabase.MAGIC or format != TypeDatabase.FORMAT:
+            self.close()
+            raise ValueError(f'\'{filename}\' is not a type database.')
+
+        self.sections = list(zip(sections[0::2], sections[1::2]))
+        self.key = self.get_string(key)
+
+    def close (self):
+        self.map.close()
+
+    # ---
+
+    def __entry (self, section, index):
+        format = TypeDatabase.SECTIONS[section]
+        return format.unpack_from(self.map, self.sections[section][0] + index * format.size)
+
+    def __bytes (self, index):
+        offsets, data = self.sections[TypeDatabase.STRING_OFFSETS][0], self.sections[TypeDatabase.STRING_DATA][0]
+        start, end = struct.unpack_from('<II', self.map, offsets + index * 4)
+        return self.map[data + start:data + end]
+
+    def __bisect (self, section, start, count, name):
+        low, high = start, start + count
+        while low < high:
+            middle = (low + high) // 2
+            if self.__bytes(self.__entry(section, middle)[0]) < name: low = middle + 1
+            else: high = middle
+        return low
+
+    def __find (self, section, start, count, name):
+        name = name.encode()
+        index = self.__bisect(section, start, count, name)
+        if index < start + count and self.__bytes(self.__entry(section, index)[0]) == name:
+            return index
+        return None
+
+    def get_string (self, index):
+        return self.__bytes(index).decode()
+
+    # ---
+
+    def get_class_count (self):
+        return self.sections[TypeDatabase.CLASSES][1]
+
+    def get_namespace_count (self):
+        return self.sections[TypeDatabase.NAMESPACES][1]
+
+    def find_class (self, name):
+        return self.__find(TypeDatabase.CLASSES, 0, self.get_class_count(), name)
+
+    def find_namespace (self, name):
+        return self.__find(TypeDatabase.NAMESPACES, 0, self.get_namespace_count(), name)
+
+    def get_class_name (self, index):
+        return self.get_string(self.__entry(TypeDatabase.CLASSES, index)[0])
+
+    def get_namespace_name (self, index):
+        return self.get_string(self.__entry(TypeDatabase.NAMESPACES, index)[0])
+
+    def get_parent (self, index):
+        parent = self.__entry(TypeDatabase.CLASSES, index)[1]
+        return parent if parent != -1 else None
+
+    # ---
+
+    def is_type (self, name, other):
+        index, target = self.find_class(name), self.find_class(other)
+        while index != None:
+            if index == target: return True
+            index = self.get_parent(index)
+        return False
+
+    def get_attribute (self, class_name, name):
+        index = self.find_class(class_name)
+        while index != None:
+            _, parent, _, _, start, count, _, _ = self.__entry(TypeDatabase.CLASSES, index)
+            found = self.__find(TypeDatabase.ATTRIBUTES, start, count, name)
+            if found != None:
+                _, type, const = self.__entry(TypeDatabase.ATTRIBUTES, found)
+                return self.get_string(type), const == 1
+            index = parent if parent != -1 else None
+        return None
+
+    # Overloads come after the signatures they inherit, as in MSClass
+    def get_method (self, class_name, name):
+        index, signatures = self.find_class(class_name), None
+        while index != None:
+            _, parent, _, _, _, _, start, count = self.__entry(TypeDatabase.CLASSES, index)
+            found = self.__find(TypeDatabase.METHODS, start, count, name)
+            if found != None:
+                signatures = self.__signatures(found, start + count, name.encode()) + (signatures or [])
+            index = parent if parent != -1 else None
+        return signatures
+
+    def get_enum (self, class_name, name):
+        index = self.find_class(class_name)
+        if index == None: return None
+
+        _, _, start, count, _, _, _, _ = self.__entry(TypeDatabase.CLASSES, index)
+        found = self.__find(TypeDatabase.ENUMS, start, count, name)
+        if found == None: return None
+
+        _, values_start, values_count = self.__entry(TypeDatabase.ENUMS, found)
+        return self.__strings(TypeDatabase.VALUES, values_start, values_count)
+
+    def __strings (self, section, start, count):
+        return [ self.get_string(self.__entry(section, i)[0]) for i in range(start, start + count) ]
+
+    def __signatures (self, index, end, name):
+        signatures = []
+        while index < end:
+            method_name, rtype, start, count = self.__entry(TypeDatabase.METHODS, index)
+            if self.__bytes(method_name) != name: break
+            signatures.append((*self.__strings(TypeDatabase.ARGUMENTS, start, count), self.get_string(rtype)))
+            index += 1
+        return signatures
+
+    # ---
+
+    def get_record (self, section, index):
+        _, _, enums_start, enums_count, attributes_start, attributes_count, methods_start, methods_count = self.__entry(section, index)
+
+        enums = []
+        for i in range(enums_start, enums_start + enums_count):
+            name, start, count = self.__entry(TypeDatabase.ENUMS, i)
+            enums.append((self.get_string(name), self.__strings(TypeDatabase.VALUES, start, count)))
+
+        attributes = []
+        for i in range(attributes_start, attributes_start + attributes_count):
+            name, type, const = self.__entry(TypeDatabase.ATTRIBUTES, i)
+            attributes.append((self.get_string(type), self.get_string(name), const == 1))
+
+        methods = []
+        for i in range(methods_start, methods_start + methods_count):
+            name, rtype, start, count = self.__entry(TypeDatabase.METHODS, i)
+            methods.append((self.get_string(name), self.get_string(rtype), self.__strings(TypeDatabase.ARGUMENTS, start, count)))
+
+        return enums, attributes, methods
+
+class DatabaseRecord:
+
+    def __init__ (self, database, index):
+        self.database, self.index = database, index
+
+    def __iter__ (self):
+        return iter(self.database.get_record(TypeDatabase.CLASSES, self.index))
+
+# ---
+
+def write_typedb (filename, key, class_records, namespace_records):
+    strings = dict()
+    def intern (string):
+        return strings.setdefault(str(string), len(strings))
+
+    by_name = lambda elem: str(elem[0]).encode()
+    class_names = sorted(class_records, key=str.encode)
+    class_indexes = { name: index for index, name in enumerate(class_names) }
+    sections = [ [] for _ in TypeDatabase.SECTIONS ]
+    _, _, classes, namespaces, enums, values, attributes, methods, arguments = sections
+
+    def add_record (records, name, parent, record):
+        enum_list, attribute_list, method_list = record
+        records.append((intern(name), parent, len(enums), len(enum_list), len(attributes), len(attribute_list),
+                        len(methods), len(method_list)))
+
+        for enum_name, enum_values in sorted(enum_list, key=by_name):
+            enums.append((intern(enum_name), len(values), len(enum_values)))
+            values.extend( (intern(value),) for value in enum_values )
+
+        for type, attribute_name, const in sorted(attribute_list, key=lambda attribute: str(attribute[1]).encode()):
+            attributes.append((intern(attribute_name), intern(type), 1 if const else 0))
+
+        for method_name, rtype, args in sorted(method_list, key=by_name):
+            methods.append((intern(method_name), intern(rtype), len(arguments), len(args)))
+            arguments.extend( (intern(arg),) for arg in args )
+
+    key = intern(key)
+
+    for class_name in class_names:
+        parent_name, record = class_records[class_name]
+        if parent_name != None and parent_name not in class_indexes:
+            raise Exception(f'Class \'{class_name}\' inherits from unknown class \'{parent_name}\' in doch.')
+        add_record(classes, class_name, class_indexes[parent_name] if parent_name != None else -1, record)
+
+    for namespace_name in sorted(namespace_records, key=str.encode):
+        add_record(namespaces, namespace_name, -1, namespace_records[namespace_name])
+
+    data, offsets = bytearray(), [(0,)]
+    for string in strings:
+        data += string.encode()
+        offsets.append((len(data),))
+    sections[TypeDatabase.STRING_OFFSETS] = offsets
+    sections[TypeDatabase.STRING_DATA] = data
+
+    temporary = f'{filename}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        # Sections are laid out one after the other, each aligned on 4 bytes
+        blobs, header, offset = [], [], TypeDatabase.HEADER.size
+        for format, entries in zip(TypeDatabase.SECTIONS, sections):
+            blob = bytes(entries) if format == TypeDatabase.BYTE else b''.join(format.pack(*entry) for entry in entries)
+            blob += b'\0' * (-len(blob) % 4)
+            header.extend((offset, len(entries)))
+            blobs.append(blob)
+            offset += len(blob)
+
+        with open(temporary, 'wb') as f:
+            f.write(TypeDatabase.HEADER.pack(TypeDatabase.MAGIC, TypeDatabase.FORMAT, key, *header))
+            for blob in blobs: f.write(blob)
+        os.replace(temporary, filename)
+    except (OSError, struct.error):
+        if os.path.exists(temporary): os.remove(temporary)
+        return False
+    return True
+
+def save_typedb (universe, class_records, namespace_records):
+    return write_typedb(universe.typedb, get_doch_key(universe.filename), class_records, namespace_records)
+
+def load_typedb (universe):
+    try:
+        database = TypeDatabase(universe.typedb)
+    except (OSError, ValueError, struct.error):
+        return False
+
+    if database.key != get_doch_key(universe.filename):
+        database.close()
+        return False
+
+    universe.database = database
+
+    classes = dict()
+    for index in range(database.get_class_count()):
+        parent = database.get_parent(index)
+        classes[database.get_class_name(index)] = (database.get_class_name(parent) if parent != None else None,
+                                                   DatabaseRecord(database, index))
+
+    namespaces = { database.get_namespace_name(index): database.get_record(TypeDatabase.NAMESPACES, index)
+                   for index in range(database.get_namespace_count()) }
+
+    compute_classes(universe, classes); compute_namespaces(universe, namespaces)
+    return True
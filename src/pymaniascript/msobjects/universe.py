@@ -0,0 +1,57 @@
+from .lazy       import LazyDict
+from .resolver   import TypeResolver
+from .classes    import compute_class_records, compute_classes
+from .namespaces import compute_namespace_records, compute_namespaces
+from .cache      import load_class_names, load_universe, save_universe
+from .typedb     import load_typedb, save_typedb
+
+from pymaniascript.doch import get_doch_filename, get_doch_key, compute_doch
+import threading
+
+class TypeUniverse:
+
+    def __init__ (self, filename=None, backend=None, typedb=None):
+        self.filename, self.backend = get_doch_filename(filename), backend
+        self.typedb, self.database = typedb, None
+        self.key, self.class_names = None, None
+        self.lock = threading.RLock()
+        self.classes, self.namespaces = LazyDict(self.load, self.lock), LazyDict(self.load, self.lock)
+        self.resolver = TypeResolver(self.classes, self.namespaces)
+
+    def get_key (self):
+        if self.key == None:
+            self.key = get_doch_key(self.filename)
+        return self.key
+
+    # Read from the cache when there is one, so that telling a class name from
+    # any other identifier does not load the whole universe
+    def get_class_names (self):
+        if self.class_names == None:
+            names = load_class_names(self) if self.typedb == None and not self.classes.loaded else None
+            self.class_names = frozenset(names if names != None else self.classes.keys())
+        return self.class_names
+
+    def load (self):
+        self.classes.loader = self.namespaces.loader = None
+        try:
+            self.__load()
+        except:
+            dict.clear(self.classes); dict.clear(self.namespaces)
+            self.classes.loader = self.namespaces.loader = self.load
+            raise
+        self.classes.loaded = self.namespaces.loaded = True
+
+    def __load (self):
+        if self.typedb != None:
+            if load_typedb(self): return
+        elif load_universe(self): return
+
+        doch = compute_doch(self.filename, self.backend)
+        classes, namespaces = compute_class_records(doch), compute_namespace_records(doch)
+
+        # Members of a database-backed universe are read from the shared mapping
+        if self.typedb != None:
+            if save_typedb(self, classes, namespaces) and load_typedb(self): return
+
+        compute_classes(self, classes); compute_namespaces(self, namespaces)
+        if self.typedb == None: save_universe(self)
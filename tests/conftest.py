@@ -0,0 +1,75 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src'))
+
+from pymaniascript.msobjects import TypeUniverse
+import pytest
+
+DOCH = '''struct Void {};
+struct Integer{};
+struct Real{};
+struct Boolean{};
+struct Text{};
+struct Vec2{Real X; Real Y;};
+struct Vec3{Real X; Real Y; Real Z;};
+struct Int2{Integer X; Integer Y;};
+struct Int3{Integer X; Integer Y; Integer Z;};
+struct Ident{};
+template <typename ElemType>
+struct Array {
+	ElemType operator[](Integer Index);
+	Integer count;
+	Array<ElemType> sort();
+	Boolean exists(ElemType Elem);
+};
+template <typename KeyType, typename ElemType>
+struct AssociativeArray {
+	ElemType operator[](KeyType Key);
+	Integer count;
+};
+
+class CNod {
+public :
+	const Ident Id;
+};
+
+class CPlayer : public CNod {
+public :
+	enum EState {
+		Idle,
+		*unused*,
+		Running,
+	};
+	const Text Name;
+	CPlayer::EState State;
+	Integer Score;
+	Void SetScore(Integer Score);
+	Void SetScore(Integer Score, Boolean Force);
+	Integer GetScore();
+};
+
+class CMode : public CNod {
+public :
+	Array<CPlayer> Players;
+	CPlayer Owner;
+	CPlayer Find(Text Name);
+};
+
+namespace MathLib {
+
+	Integer Abs(Integer _Argument1);
+	Real Abs(Real _Argument1);
+	const Real Pi = 3.14159;
+};
+'''
+
+@pytest.fixture(scope='session')
+def doch (tmp_path_factory):
+    filename = tmp_path_factory.mktemp('doch') / 'doc.h'
+    filename.write_text(DOCH)
+    return str(filename)
+
+@pytest.fixture(scope='session')
+def universe (doch):
+    return TypeUniverse(doch)
@@ -0,0 +1,31 @@
+from pymaniascript.compiler.lexer import Lexer
+import pytest
+import time
+
+# Each case is lexed at two sizes, four times apart. Linear scanning takes
+# about four times as long on the larger one, a quadratic one sixteen times.
+CASES = { 'unterminated block comments'   : (lambda n: '/* x ' * n, 2000),
+          'unterminated interpolations'   : (lambda n: '}}} x ' * n, 1000),
+          'unterminated escaped string'   : (lambda n: '"' + '\\"' * n, 5000),
+          'unterminated triple string'    : (lambda n: 'declare Text T = """' + '<label text="a"/>\n' * n, 2000),
+          'long block comment'            : (lambda n: '/*' + ('x' * 79 + '\n') * n + '*/', 20000),
+          'long triple string'            : (lambda n: '"""' + '<label text="a" z="{{b}}"/>\n' * n + '"""', 40000),
+          'many strings'                  : (lambda n: '"a" "b\\"c" """d""" ' * n, 2000),
+          'many interpolations'           : (lambda n: '"""' + 'a {{{ X }}} b ' * n + '"""', 2000) }
+
+def lex (universe, text):
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in Lexer(universe).tokenize(text): pass
+        duration = time.perf_counter() - start
+        best = duration if best == None else min(best, duration)
+    return best
+
+@pytest.mark.parametrize('case', CASES)
+def test_linear_time (universe, case):
+    make, size = CASES[case]
+    lex(universe, make(size // 10))
+
+    small, large = lex(universe, make(size)), lex(universe, make(size * 4))
+    assert large < 10 * max(small, 1e-3), f'{case}: {small:.3f}s -> {large:.3f}s for a text four times longer'
@@ -0,0 +1,77 @@
+from pymaniascript.compiler.files import FileCache
+from pymaniascript.compiler.parser import Parser
+from pymaniascript.msobjects import TypeUniverse
+import pytest
+import random
+import sys
+import threading
+
+THREADS, COMPILATIONS = 16, 12
+
+# Libraries include the ones before them, and each also includes a shared
+# base, so that threads keep meeting on the same files
+def write_scripts (root):
+    (root / 'Libs').mkdir(parents=True)
+    (root / 'Libs' / 'Base.Script.txt').write_text(
+        '#Struct K_Base { Integer A; Text B; }\n'
+        'declare Integer G_Base;\n'
+        'Integer Twice(Integer _A) { return _A * 2; }\n'
+        'Integer Broken(Integer _A) { return "x"; }\n')
+
+    for i in range(8):
+        includes = [ f'#Include "Libs/Lib{j}.Script.txt" as L{j}\n' for j in range(max(0, i - 2), i) ]
+        body = ''.join( f'Integer F{i}_{j}(Integer _A) {{ return Base::Twice(_A) + {j}; }}\n' for j in range(10) )
+        warnings = ''.join( f'Void W{i}_{j}() {{ declare Integer V = {j}; V + Missing{j}; }}\n' for j in range(i) )
+        (root / 'Libs' / f'Lib{i}.Script.txt').write_text(
+            ''.join(includes) + '#Include "Libs/Base.Script.txt" as Base\n#Include "MathLib" as ML\n' + body + warnings)
+
+    for i in range(4):
+        includes = ''.join( f'#Include "Libs/Lib{j}.Script.txt" as L{j}\n' for j in range(i, 8, 2) )
+        (root / f'Main{i}.Script.txt').write_text(
+            '#RequireContext CMode\n#Include "MathLib" as ML\n' + includes +
+            f'main() {{\n\tdeclare Integer X = L{i}::F{i}_1(ML::Abs(-{i}));\n'
+            f'\tdeclare CPlayer P = Owner;\n\tlog(X ^ Players.count ^ P.Unknown);\n}}\n')
+
+    (root / 'Bad.Script.txt').write_text('#Include "Libs/Lib7.Script.txt" as L7\nmain() {\n\tdeclare Integer X = ;\n}\n')
+    return sorted( path.name for path in root.iterdir() if path.is_file() )
+
+def reports (prog):
+    return sorted( str(report) for report in prog.reports )
+
+@pytest.mark.parametrize('cached', [False, True])
+def test_threads (doch, tmp_path, cached):
+    root = tmp_path / 'Scripts'
+    scripts = write_scripts(root)
+    cache_dir = str(tmp_path / 'cache') if cached else None
+
+    universe = TypeUniverse(doch)
+    expected = { script: reports(Parser(str(root), universe, files=FileCache()).parse_file(script)) for script in scripts }
+    assert all( len(expected[script]) != 0 for script in scripts )
+
+    # A fresh universe, loaded by whichever thread needs it first
+    universe, shared = TypeUniverse(doch), FileCache(max_entries=6)
+    barrier, mismatches = threading.Barrier(THREADS), list()
+
+    def work (seed):
+        rnd = random.Random(seed)
+        barrier.wait()
+        for _ in range(COMPILATIONS):
+            script = rnd.choice(scripts)
+            files = shared if rnd.random() < 0.7 else FileCache()
+            try:
+                got = reports(Parser(str(root), universe, files=files, cache_dir=cache_dir).parse_file(script))
+            except Exception as e:
+                got = [ f'{type(e).__name__}: {e}' ]
+            if got != expected[script]: mismatches.append((script, got))
+            if rnd.random() < 0.1: shared.invalidate(str(root / 'Libs' / 'Base.Script.txt'))
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    try:
+        threads = [ threading.Thread(target=work, args=(seed,)) for seed in range(THREADS) ]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert mismatches == []